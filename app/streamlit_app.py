@@ -5,22 +5,32 @@ Provides interactive visualization of fortnightly narrative reports.
 
 from __future__ import annotations
 
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import msgspec
+import numpy as np
+import orjson
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
-import pandas as pd
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.runner import run_pipeline
-from pipeline.models import FortnightlyReport, RankedNarrative
+from pipeline.models import (
+    BuildIdea,
+    EvidenceCard,
+    FortnightlyReport,
+    RankedNarrative,
+    ScoreBreakdown,
+    SignalEvent,
+    SourceSubtype,
+    SourceType,
+)
 
 
 st.set_page_config(
@@ -31,31 +41,108 @@ st.set_page_config(
 )
 
 
+# Dashboard styles, injected once per script run from main()
+_CSS = """
+<style>
+.main-header {
+    background: linear-gradient(135deg, #14F195 0%, #9945FF 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-size: 2.5rem;
+    font-weight: 800;
+    margin-bottom: 0;
+}
+.sub-header {
+    color: #888;
+    font-size: 1.1rem;
+    margin-top: -10px;
+}
+.metric-card {
+    background: #1a1a2e;
+    border-radius: 12px;
+    padding: 20px;
+    border: 1px solid #333;
+}
+.narrative-card {
+    background: #16213e;
+    border-radius: 12px;
+    padding: 24px;
+    margin: 16px 0;
+    border-left: 4px solid #14F195;
+}
+.evidence-card {
+    background: #0f3460;
+    border-radius: 8px;
+    padding: 16px;
+    margin: 8px 0;
+    border: 1px solid #1a1a4e;
+}
+.idea-card {
+    background: #1a1a2e;
+    border-radius: 8px;
+    padding: 16px;
+    margin: 8px 0;
+    border: 1px solid #9945FF44;
+}
+.score-badge {
+    display: inline-block;
+    padding: 4px 12px;
+    border-radius: 20px;
+    font-weight: 600;
+    font-size: 0.9rem;
+}
+</style>
+"""
+
+
 def load_or_run_report() -> FortnightlyReport | None:
     """Load existing report or run pipeline."""
-    reports_dir = Path("reports")
-
-    # Check for existing reports
-    existing_reports = sorted(reports_dir.glob("report_*.json"), reverse=True) if reports_dir.exists() else []
+    latest = _latest_report_file()
 
-    if existing_reports:
-        latest = existing_reports[0]
+    if latest:
+        path, mtime = latest
         try:
-            data = json.loads(latest.read_text())
-            return _reconstruct_report(data)
+            # mtime is part of the cache key so a rewritten report is reloaded
+            return _load_report_cached(path, mtime)
         except Exception as e:
             st.warning(f"Failed to load report: {e}")
 
     return None
 
 
-def _reconstruct_report(data: dict) -> FortnightlyReport:
-    """Reconstruct FortnightlyReport from JSON data."""
-    from pipeline.models import (
-        FortnightlyReport, RankedNarrative, ScoreBreakdown,
-        EvidenceCard, BuildIdea, SignalEvent, SourceType, SourceSubtype,
-    )
+@st.cache_data(ttl=30, show_spinner=False)
+def _latest_report_file(pattern: str = "report_*.json") -> tuple[str, float] | None:
+    """Return (path, mtime) of the newest report matching pattern, rescanning at most every 30s."""
+    reports_dir = Path("reports")
+    existing_reports = sorted(reports_dir.glob(pattern), reverse=True) if reports_dir.exists() else []
+    if not existing_reports:
+        return None
+    latest = existing_reports[0]
+    return str(latest), latest.stat().st_mtime
+
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _load_report_cached(path: str, mtime: float) -> FortnightlyReport:
+    """Decode a report file straight into the pipeline models, cached across reruns."""
+    return _reconstruct_report(Path(path).read_bytes())
+
+
+def _reconstruct_report(raw: bytes) -> FortnightlyReport:
+    """Reconstruct FortnightlyReport from JSON bytes.
+
+    msgspec validates and builds the nested dataclasses (enums, datetimes,
+    evidence cards, build ideas) in C rather than walking the dict by hand.
+    Reports written before a field existed fail that strict validation and
+    are rebuilt field by field with defaults instead.
+    """
+    try:
+        return msgspec.json.decode(raw, type=FortnightlyReport)
+    except msgspec.ValidationError:
+        return _reconstruct_report_lenient(orjson.loads(raw))
 
+
+def _reconstruct_report_lenient(data: dict) -> FortnightlyReport:
+    """Reconstruct FortnightlyReport from a JSON dict, defaulting missing fields."""
     narratives = []
     for n_data in data.get("narratives", []):
         score_data = n_data.get("score", {})
@@ -137,70 +224,15 @@ def _reconstruct_report(data: dict) -> FortnightlyReport:
 
 def render_header(report: FortnightlyReport):
     """Render dashboard header."""
-    st.markdown("""
-    <style>
-    .main-header {
-        background: linear-gradient(135deg, #14F195 0%, #9945FF 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 2.5rem;
-        font-weight: 800;
-        margin-bottom: 0;
-    }
-    .sub-header {
-        color: #888;
-        font-size: 1.1rem;
-        margin-top: -10px;
-    }
-    .metric-card {
-        background: #1a1a2e;
-        border-radius: 12px;
-        padding: 20px;
-        border: 1px solid #333;
-    }
-    .narrative-card {
-        background: #16213e;
-        border-radius: 12px;
-        padding: 24px;
-        margin: 16px 0;
-        border-left: 4px solid #14F195;
-    }
-    .evidence-card {
-        background: #0f3460;
-        border-radius: 8px;
-        padding: 16px;
-        margin: 8px 0;
-        border: 1px solid #1a1a4e;
-    }
-    .idea-card {
-        background: #1a1a2e;
-        border-radius: 8px;
-        padding: 16px;
-        margin: 8px 0;
-        border: 1px solid #9945FF44;
-    }
-    .score-badge {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
+    aggregates = _report_aggregates(report.run_id, report)
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown('<p class="main-header">Solana Narrative Detector</p>', unsafe_allow_html=True)
-        st.markdown(
-            f'<p class="sub-header">Fortnightly Analysis: '
-            f'{report.window_start.strftime("%b %d")} — {report.window_end.strftime("%b %d, %Y")}</p>',
-            unsafe_allow_html=True,
-        )
+        st.markdown(aggregates["sub_header"], unsafe_allow_html=True)
 
     with col2:
-        st.markdown(f"**Run ID**: `{report.run_id[:16]}`")
-        st.markdown(f"**Generated**: {report.generated_at.strftime('%Y-%m-%d %H:%M')}")
+        st.markdown(aggregates["run_id_line"])
+        st.markdown(aggregates["generated_line"])
 
 
 def render_metrics(report: FortnightlyReport):
@@ -217,31 +249,59 @@ def render_metrics(report: FortnightlyReport):
     with cols[3]:
         st.metric("Sources Used", len(meta.get("sources_used", [])))
     with cols[4]:
-        avg_confidence = sum(n.confidence for n in report.narratives) / max(1, len(report.narratives))
+        avg_confidence = _report_aggregates(report.run_id, report)["avg_confidence"]
         st.metric("Avg Confidence", f"{avg_confidence:.0%}")
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def _report_aggregates(run_id: str, _report: FortnightlyReport) -> dict:
+    """Compute per-report aggregates and display strings once.
+
+    Keyed on run_id; the report itself isn't hashed.
+    """
+    narratives = _report.narratives
+    return {
+        "avg_confidence": sum(n.confidence for n in narratives) / max(1, len(narratives)),
+        "labels": tuple(f"#{n.rank} {n.label}" for n in narratives),
+        "scores": tuple(n.score.composite for n in narratives),
+        "sub_header": (
+            f'<p class="sub-header">Fortnightly Analysis: '
+            f'{_report.window_start.strftime("%b %d")} — {_report.window_end.strftime("%b %d, %Y")}</p>'
+        ),
+        "run_id_line": f"**Run ID**: `{_report.run_id[:16]}`",
+        "generated_line": f"**Generated**: {_report.generated_at.strftime('%Y-%m-%d %H:%M')}",
+    }
+
+
 def render_narrative_overview(report: FortnightlyReport):
     """Render narrative ranking overview chart."""
     if not report.narratives:
         st.info("No narratives detected in this window.")
         return
 
+    aggregates = _report_aggregates(report.run_id, report)
+    fig = _build_overview_fig(aggregates["labels"], aggregates["scores"])
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_overview_fig(labels: tuple[str, ...], scores: tuple[float, ...]) -> dict:
+    """Build the ranking bar chart; cached so reruns skip figure construction."""
     # Horizontal bar chart of scores
-    labels = [f"#{n.rank} {n.label}" for n in report.narratives]
-    scores = [n.score.composite for n in report.narratives]
-    confidences = [n.confidence for n in report.narratives]
+    # NumPy arrays are base64-encoded by plotly instead of serialized element-wise
+    label_arr = np.array(labels)
+    score_arr = np.array(scores, dtype=np.float32)
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        y=labels[::-1],
-        x=scores[::-1],
+        y=label_arr[::-1],
+        x=score_arr[::-1],
         orientation="h",
         marker=dict(
-            color=scores[::-1],
+            color=score_arr[::-1],
             colorscale=[[0, "#9945FF"], [0.5, "#14F195"], [1, "#00FFA3"]],
         ),
-        text=[f"{s:.2f}" for s in scores[::-1]],
+        text=[f"{s:.2f}" for s in score_arr[::-1]],
         textposition="auto",
         hovertemplate="<b>%{y}</b><br>Score: %{x:.3f}<extra></extra>",
     ))
@@ -255,28 +315,35 @@ def render_narrative_overview(report: FortnightlyReport):
         paper_bgcolor="rgba(0,0,0,0)",
         font=dict(color="#ccc"),
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
 
 
 def render_score_radar(narrative: RankedNarrative):
     """Render radar chart for score breakdown."""
-    categories = ["Velocity", "Breadth", "Cross-Domain", "Novelty", "Credibility"]
-    values = [
+    values = (
         narrative.score.velocity,
         narrative.score.breadth,
         narrative.score.cross_domain,
         narrative.score.novelty,
         narrative.score.credibility,
-    ]
+    )
+    fig = _build_radar_fig(narrative.narrative_id, narrative.label, values)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_radar_fig(narrative_id: str, label: str, values: tuple[float, ...]) -> dict:
+    """Build the score breakdown radar chart for one narrative."""
+    categories = ["Velocity", "Breadth", "Cross-Domain", "Novelty", "Credibility"]
 
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
-        r=values + [values[0]],
+        r=list(values) + [values[0]],
         theta=categories + [categories[0]],
         fill="toself",
         fillcolor="rgba(20, 241, 149, 0.2)",
         line=dict(color="#14F195", width=2),
-        name=narrative.label,
+        name=label,
     ))
 
     fig.update_layout(
@@ -291,7 +358,7 @@ def render_score_radar(narrative: RankedNarrative):
         paper_bgcolor="rgba(0,0,0,0)",
         font=dict(color="#ccc", size=11),
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
 
 
 def render_timeline(narrative: RankedNarrative):
@@ -299,14 +366,19 @@ def render_timeline(narrative: RankedNarrative):
     if not narrative.timeline_data:
         return
 
-    df = pd.DataFrame(narrative.timeline_data)
-    if df.empty:
-        return
+    timeline = narrative.timeline_data
+    dates = tuple(d["date"] for d in timeline)
+    counts = tuple(d["count"] for d in timeline)
+    st.plotly_chart(_build_timeline_fig(narrative.narrative_id, dates, counts), use_container_width=True)
 
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_timeline_fig(narrative_id: str, dates: tuple[str, ...], counts: tuple[int, ...]) -> dict:
+    """Build the daily signal timeline chart for one narrative."""
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=df["date"],
-        y=df["count"],
+        x=list(dates),
+        y=np.array(counts, dtype=np.int32),
         mode="lines+markers",
         fill="tozeroy",
         fillcolor="rgba(153, 69, 255, 0.2)",
@@ -324,7 +396,7 @@ def render_timeline(narrative: RankedNarrative):
         paper_bgcolor="rgba(0,0,0,0)",
         font=dict(color="#ccc"),
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
 
 
 def render_narrative_detail(narrative: RankedNarrative):
@@ -355,8 +427,9 @@ def render_narrative_detail(narrative: RankedNarrative):
 
     with tab2:
         st.markdown(f"#### Top Evidence ({len(narrative.evidence_cards)} signals)")
-        for i, ec in enumerate(narrative.evidence_cards, 1):
-            with st.expander(f"{i}. {ec.summary[:100]}...", expanded=i <= 3):
+        # Top cards get full expanders; the rest go into a single table element
+        for i, ec in enumerate(narrative.evidence_cards[:3], 1):
+            with st.expander(f"{i}. {ec.summary[:100]}...", expanded=True):
                 st.markdown(f"**Source**: {ec.event.source_subtype.value} | **Relevance**: {ec.relevance_score:.2f}")
                 st.markdown(f"**Time**: {ec.event.timestamp.strftime('%Y-%m-%d %H:%M')}")
                 if ec.metric_highlight:
@@ -366,6 +439,27 @@ def render_narrative_detail(narrative: RankedNarrative):
                 if ec.event.author:
                     st.markdown(f"**Author**: {ec.event.author}")
 
+        if len(narrative.evidence_cards) > 3:
+            rows = [
+                {
+                    "#": i,
+                    "Summary": ec.summary[:200],
+                    "Source": ec.event.source_subtype.value,
+                    "Relevance": round(ec.relevance_score, 2),
+                    "Time": ec.event.timestamp.strftime("%Y-%m-%d %H:%M"),
+                    "Metrics": ec.metric_highlight or "",
+                    "URL": ec.event.url or None,
+                    "Author": ec.event.author,
+                }
+                for i, ec in enumerate(narrative.evidence_cards[3:], 4)
+            ]
+            st.dataframe(
+                rows,
+                column_config={"URL": st.column_config.LinkColumn("URL")},
+                use_container_width=True,
+                hide_index=True,
+            )
+
     with tab3:
         col1, col2 = st.columns(2)
         with col1:
@@ -412,27 +506,37 @@ def render_export(report: FortnightlyReport):
     col1, col2 = st.columns(2)
 
     with col1:
-        reports_dir = Path("reports")
-        md_files = sorted(reports_dir.glob("report_*.md"), reverse=True) if reports_dir.exists() else []
-        if md_files:
-            content = md_files[0].read_text()
+        latest_md = _latest_report_file("report_*.md")
+        if latest_md:
+            path, mtime = latest_md
             st.download_button(
                 "Download Markdown Report",
-                content,
-                file_name=md_files[0].name,
+                _read_report_text(path, mtime),
+                file_name=Path(path).name,
                 mime="text/markdown",
             )
 
     with col2:
-        json_str = report.to_json()
         st.download_button(
             "Download JSON Bundle",
-            json_str,
+            _report_json(report.run_id, report),
             file_name=f"report_{report.run_id}.json",
             mime="application/json",
         )
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def _read_report_text(path: str, mtime: float) -> str:
+    """Read a report file once per (path, mtime)."""
+    return Path(path).read_text()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _report_json(run_id: str, _report: FortnightlyReport) -> bytes:
+    """Serialize the report for download once per run_id, using orjson."""
+    return orjson.dumps(_report.to_dict(), default=str, option=orjson.OPT_INDENT_2)
+
+
 def main():
     """Main dashboard entry point."""
     # Sidebar
@@ -494,6 +598,7 @@ def main():
         return
 
     # Render dashboard
+    st.markdown(_CSS, unsafe_allow_html=True)
     render_header(report)
     st.markdown("---")
     render_metrics(report)
@@ -507,9 +612,16 @@ def main():
     st.markdown("---")
     st.markdown("## Narrative Details")
 
-    for narrative in report.narratives:
+    # Render one narrative at a time so reruns don't rebuild every tab/expander
+    if report.narratives:
+        labels = _report_aggregates(report.run_id, report)["labels"]
+        selected = st.selectbox(
+            "Narrative",
+            options=range(len(labels)),
+            format_func=labels.__getitem__,
+        )
         with st.container():
-            render_narrative_detail(narrative)
+            render_narrative_detail(report.narratives[selected])
             st.markdown("---")
 
     # Methodology & Export
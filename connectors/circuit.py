@@ -0,0 +1,124 @@
+"""Per-host circuit breakers for outbound connector calls.
+
+A breaker opens after repeated failures so later calls to a dead endpoint
+fail fast (and the connector drops to its snapshot fallback) instead of
+each waiting out a timeout. After a cooldown one probe is let through;
+success closes the breaker, failure re-opens it with a doubled cooldown.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from pipeline.logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed -> open -> half-open breaker for a single endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.7,
+        window_secs: float = 20.0,
+        min_calls: int = 5,
+        cooldown: float = 20.0,
+        max_cooldown: float = 300.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.window_secs = window_secs
+        self.min_calls = min_calls
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self.state = CLOSED
+        self.fail_count = 0  # consecutive failures
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self._outcomes: deque[tuple[float, bool]] = deque()  # (time, ok) within window
+        self._probe_in_flight = False
+        # Connectors run in worker threads and share breakers per host
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go out now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: a single probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._record(True)
+            self.fail_count = 0
+            if self.state != CLOSED:
+                logger.info("circuit_closed", endpoint=self.name)
+            self.state = CLOSED
+            self.cooldown = self.base_cooldown
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._record(False)
+            self.fail_count += 1
+            if self.state == HALF_OPEN:
+                # Probe failed: back off harder before the next one
+                self._open(min(self.max_cooldown, self.cooldown * 2))
+            elif self.state == CLOSED and self._should_trip():
+                self._open(self.base_cooldown)
+
+    def _record(self, ok: bool):
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        while self._outcomes and now - self._outcomes[0][0] > self.window_secs:
+            self._outcomes.popleft()
+
+    def _should_trip(self) -> bool:
+        if self.fail_count >= self.failure_threshold:
+            return True
+        if len(self._outcomes) < self.min_calls:
+            return False
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes) > self.failure_rate
+
+    def _open(self, cooldown: float):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.cooldown = cooldown
+        self._probe_in_flight = False
+        logger.warning("circuit_opened", endpoint=self.name, cooldown=cooldown)
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    """The shared breaker for a URL's host, created on first use."""
+    host = urlsplit(url).netloc or url
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = CircuitBreaker(host)
+        return breaker
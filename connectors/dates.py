@@ -0,0 +1,38 @@
+"""Timestamp parsing shared by the connectors.
+
+Fast paths first: ciso8601 for ISO-8601 API timestamps and the stdlib
+RFC 2822 parser for feed dates. dateutil is only imported for the odd
+formats neither handles.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - stdlib fallback below
+    ciso8601 = None
+
+
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp (``Z`` suffix allowed) into a datetime."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_feed_date(value: str) -> datetime:
+    """Parse an RSS/Atom date string: RFC 2822, then ISO-8601, then anything dateutil takes."""
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return parse_iso_timestamp(value)
+    except ValueError:
+        pass
+    from dateutil import parser as dateparser
+
+    return dateparser.parse(value)
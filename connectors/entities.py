@@ -0,0 +1,153 @@
+"""Keyword tables and matching for connector entity extraction.
+
+Each connector maps canonical entity names to the keywords that signal them.
+EntityMatcher compiles a table into a single Aho-Corasick automaton so every
+keyword is found in one linear scan of the text. Without pyahocorasick it
+falls back to one compiled regex alternation.
+"""
+
+from __future__ import annotations
+
+import re
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - regex fallback below
+    ahocorasick = None
+
+
+GITHUB_ENTITY_KEYWORDS = {
+    "anchor": ["anchor"],
+    "metaplex": ["metaplex"],
+    "jupiter": ["jupiter", "jup"],
+    "marinade": ["marinade", "msol"],
+    "jito": ["jito"],
+    "drift": ["drift"],
+    "tensor": ["tensor"],
+    "helius": ["helius"],
+    "orca": ["orca", "whirlpool"],
+    "raydium": ["raydium"],
+    "phantom": ["phantom"],
+    "squads": ["squads"],
+    "helium": ["helium", "hnt"],
+    "compressed-nft": ["compressed nft", "cnft", "state compression", "bubblegum"],
+    "token-extensions": ["token-2022", "token extensions", "token22"],
+    "blinks": ["blinks", "solana actions"],
+    "solana-mobile": ["solana mobile", "saga"],
+    "solana-pay": ["solana pay"],
+    "depin": ["depin", "decentralized physical"],
+    "ai-agents": ["ai agent", "solana ai", "ai crypto"],
+    "mev": ["mev", "sandwich", "jito tip"],
+    "validator": ["validator", "stake pool"],
+    "svm": ["svm", "solana virtual machine", "neon evm", "eclipse"],
+}
+
+RSS_ENTITY_KEYWORDS = {
+    "jupiter": ["jupiter", "jup aggregator"],
+    "marinade": ["marinade", "msol", "mnde"],
+    "jito": ["jito", "jitosol", "mev on solana"],
+    "drift": ["drift protocol", "drift exchange"],
+    "tensor": ["tensor", "nft marketplace"],
+    "helius": ["helius", "rpc provider"],
+    "orca": ["orca", "whirlpool"],
+    "raydium": ["raydium"],
+    "metaplex": ["metaplex"],
+    "compressed-nft": ["compressed nft", "cnft", "state compression"],
+    "token-extensions": ["token-2022", "token extensions", "token22"],
+    "blinks": ["blinks", "blockchain links", "solana actions"],
+    "depin": ["depin", "decentralized physical infrastructure"],
+    "solana-mobile": ["solana mobile", "saga phone", "chapter 2"],
+    "ai-agents": ["ai agent", "artificial intelligence", "machine learning", "llm"],
+    "mev": ["mev", "maximal extractable value", "sandwich attack"],
+    "validator": ["validator", "stake pool", "staking"],
+    "svm": ["svm", "solana virtual machine"],
+    "firedancer": ["firedancer", "frankendancer", "jump crypto validator"],
+    "grpc": ["grpc", "geyser", "yellowstone"],
+    "solana-pay": ["solana pay"],
+    "nft": ["nft", "digital collectible"],
+    "defi": ["defi", "decentralized finance", "lending", "borrowing"],
+    "payments": ["payments", "point of sale", "checkout"],
+    "gaming": ["gaming", "game", "play to earn"],
+    "dao": ["dao", "governance", "multisig"],
+}
+
+TWITTER_ENTITY_KEYWORDS = {
+    "jupiter": ["jupiter", "@jupiterexchange", "jup"],
+    "marinade": ["marinade", "msol", "mnde"],
+    "jito": ["jito", "jitosol", "@jito_sol"],
+    "drift": ["drift", "@driftprotocol"],
+    "tensor": ["tensor", "@tensor_hq"],
+    "helius": ["helius", "@heaboronin"],
+    "orca": ["orca", "@orca_so"],
+    "raydium": ["raydium"],
+    "metaplex": ["metaplex"],
+    "phantom": ["phantom", "@phantom"],
+    "compressed-nft": ["cnft", "compressed nft", "state compression"],
+    "token-extensions": ["token-2022", "token extensions"],
+    "blinks": ["blinks", "solana actions"],
+    "depin": ["depin"],
+    "solana-mobile": ["solana mobile", "saga"],
+    "ai-agents": ["ai agent", "solana ai", "ai x crypto", "deai"],
+    "mev": ["mev", "jito tips"],
+    "firedancer": ["firedancer", "frankendancer"],
+    "grpc": ["grpc", "geyser"],
+    "defi": ["defi"],
+    "nft": ["nft"],
+    "payments": ["solana pay", "payments"],
+    "gaming": ["gaming", "gamefi"],
+    "dao": ["dao", "governance"],
+    "svm": ["svm", "solana virtual machine", "eclipse", "neon"],
+    "validator": ["validator", "staking"],
+}
+
+
+class EntityMatcher:
+    """Finds the entities whose keywords occur in a text.
+
+    Matching is plain substring containment, same as ``kw in text``.
+    """
+
+    def __init__(self, entity_keywords: dict[str, list[str]]):
+        self.entity_keywords = entity_keywords
+        # A keyword may signal more than one entity
+        keyword_entities: dict[str, list[str]] = {}
+        for entity, keywords in entity_keywords.items():
+            for kw in keywords:
+                keyword_entities.setdefault(kw, []).append(entity)
+
+        self._automaton = None
+        self._pattern = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for kw, entities in keyword_entities.items():
+                automaton.add_word(kw, tuple(entities))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # A lookahead finds the longest keyword starting at each position;
+            # every shorter keyword that is its prefix also occurs there, so
+            # each hit maps to the entities of all of its keyword prefixes.
+            ordered = sorted(keyword_entities, key=len, reverse=True)
+            self._pattern = re.compile(
+                "(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))"
+            )
+            self._prefix_entities = {
+                longest: frozenset(
+                    entity
+                    for kw, entities in keyword_entities.items()
+                    if longest.startswith(kw)
+                    for entity in entities
+                )
+                for longest in keyword_entities
+            }
+
+    def match(self, text_lower: str) -> list[str]:
+        """Return matched entities, in table order, for already-lowercased text."""
+        found = set()
+        if self._automaton is not None:
+            for _, entities in self._automaton.iter(text_lower):
+                found.update(entities)
+        else:
+            for m in self._pattern.finditer(text_lower):
+                found |= self._prefix_entities[m.group(1)]
+        return [entity for entity in self.entity_keywords if entity in found]
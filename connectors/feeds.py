@@ -0,0 +1,79 @@
+"""Conditional feed downloads shared by the RSS and Nitter connectors.
+
+Each feed's ETag / Last-Modified and its parsed entries are kept in a
+diskcache. The next download revalidates with If-None-Match /
+If-Modified-Since; on a 304 the stored entries are reused, so an unchanged
+feed costs neither the body download nor the XML parse.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import diskcache
+
+from pipeline.logging import get_logger
+
+if TYPE_CHECKING:
+    from connectors.base import BaseConnector
+
+logger = get_logger(__name__)
+
+
+def _conditional_headers(state: Optional[dict]) -> Optional[dict]:
+    """If-None-Match / If-Modified-Since headers from a stored feed state."""
+    if not state:
+        return None
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("modified"):
+        headers["If-Modified-Since"] = state["modified"]
+    return headers or None
+
+
+def fetch_feed_entries(
+    connector: BaseConnector,
+    urls: list[str],
+    state_cache: Optional[diskcache.Cache],
+    max_entries: int,
+) -> list[Optional[list]]:
+    """Download and parse feeds concurrently, revalidating against stored state.
+
+    Returns, per URL and in order, up to ``max_entries`` feedparser entries,
+    or None when the download failed. A feed that doesn't parse yields [].
+    """
+    # feedparser is slow to import; snapshot-only runs never get here
+    import feedparser
+
+    states = []
+    for url in urls:
+        state = state_cache.get(url) if state_cache is not None else None
+        states.append(state if isinstance(state, dict) else None)
+
+    responses = connector.fetch_batch(urls, url_headers=[_conditional_headers(s) for s in states])
+
+    results: list[Optional[list]] = []
+    for url, state, response in zip(urls, states, responses):
+        if response is None:
+            results.append(None)
+            continue
+        if response.status_code == 304 and state:
+            logger.debug("feed_not_modified", connector=connector.name, url=url)
+            results.append(state["entries"])
+            continue
+
+        # Headers let feedparser pick up the charset and the final URL
+        feed = feedparser.parse(response.content, response_headers=response.headers)
+        if feed.bozo and not feed.entries:
+            logger.warning("feed_parse_error", connector=connector.name, url=url)
+            results.append([])
+            continue
+
+        entries = feed.entries[:max_entries]
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if (etag or modified) and state_cache is not None:
+            state_cache.set(url, {"etag": etag, "modified": modified, "entries": entries})
+        results.append(entries)
+    return results
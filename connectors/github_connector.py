@@ -9,18 +9,84 @@ Monitors Solana-related repositories for:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlencode
 
-from connectors.base import BaseConnector
-from pipeline.models import SignalEvent, SourceType, SourceSubtype
+import diskcache
+import httpx
+import orjson
+
+from connectors.base import BaseConnector, CACHE_DIR, HTTP_CONNECT_RETRIES, run_async
+from connectors.dates import parse_iso_timestamp
+from connectors.entities import EntityMatcher, GITHUB_ENTITY_KEYWORDS
+from pipeline.models import SignalEvent, SourceType, SourceSubtype, decode_events
 from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
+GITHUB_API = "https://api.github.com"
+
+_ENTITY_MATCHER = EntityMatcher(GITHUB_ENTITY_KEYWORDS)
+
+# GitHub API calls are small; fail fast on connect, allow slower bodies
+GITHUB_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+# api.github.com speaks HTTP/2, so concurrent calls multiplex over few connections
+GITHUB_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+
+def _slim_release(release: dict) -> dict:
+    """Keep only the release fields the connector reads, with a truncated body."""
+    return {
+        "published_at": release.get("published_at"),
+        "tag_name": release.get("tag_name", ""),
+        "name": release.get("name", release.get("tag_name", "")),
+        "body": (release.get("body") or "")[:300],
+        "html_url": release.get("html_url", ""),
+        "author": {"login": (release.get("author") or {}).get("login", "")},
+    }
+
+
+# Repos per GraphQL request; keeps each query well under GitHub's node limits
+GRAPHQL_BATCH_SIZE = 25
+
+_RELEASE_NODE_FIELDS = "tagName name publishedAt url description author { login }"
+
+
+def _release_from_node(node: dict) -> dict:
+    """Map a GraphQL Release node onto the REST release shape the connector reads."""
+    return _slim_release(
+        {
+            "published_at": node.get("publishedAt"),
+            "tag_name": node.get("tagName") or "",
+            "name": node.get("name"),
+            "body": node.get("description"),
+            "html_url": node.get("url") or "",
+            "author": node.get("author"),
+        }
+    )
+
+
+def _releases_query(count: int, per_repo: int) -> str:
+    """Build one query with an aliased repository block per repo."""
+    args = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    blocks = " ".join(
+        f"r{i}: repository(owner: $o{i}, name: $n{i}) "
+        f"{{ releases(first: {per_repo}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+        f"{{ nodes {{ {_RELEASE_NODE_FIELDS} }} }} }}"
+        for i in range(count)
+    )
+    return f"query({args}) {{ {blocks} }}"
+
+
+def _decode_items(content: bytes, slim: Callable[[dict], dict]) -> list[dict]:
+    """Decode a JSON array body and slim each element before it is cached."""
+    data = orjson.loads(content)
+    return [slim(item) for item in data] if isinstance(data, list) else []
+
 
 class GitHubConnector(BaseConnector):
     """Connector for GitHub developer activity."""
@@ -35,238 +101,375 @@ class GitHubConnector(BaseConnector):
         self.search_queries = gh_config.get("search_queries", ["solana"])
         self.orgs = gh_config.get("orgs", ["solana-labs"])
         self.rate_limit_rps = gh_config.get("rate_limit_rps", 8.0)
-
-    def _headers(self) -> dict:
-        headers = {"Accept": "application/vnd.github.v3+json"}
+        self.max_concurrency = gh_config.get("max_concurrency", 20)
+        # The token is fixed for the connector's lifetime, so build the headers once
+        self._headers = {"Accept": "application/vnd.github.v3+json"}
         if self.token:
-            headers["Authorization"] = f"token {self.token}"
-        return headers
-
-    def _search_repos(self, query: str, sort: str = "updated", per_page: int = 30) -> list[dict]:
+            self._headers["Authorization"] = f"token {self.token}"
+        # ETag -> body store for conditional requests, kept across runs
+        self._etag_cache = (
+            diskcache.Cache(str(CACHE_DIR / "github_etags")) if cache_enabled else None
+        )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """One pooled HTTP/2 client per fetch, with the GitHub headers set once."""
+        return httpx.AsyncClient(
+            base_url=GITHUB_API,
+            headers=self._headers,
+            timeout=GITHUB_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=GITHUB_LIMITS, retries=HTTP_CONNECT_RETRIES
+            ),
+        )
+
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        path: str,
+        params: dict,
+        slim: Optional[Callable[[dict], dict]] = None,
+    ):
+        """GET a GitHub API path and decode the JSON body, bounded by the semaphore.
+
+        Concurrent calls for the same path and params share one request. With
+        ``slim``, the body must be a JSON array and each element is reduced by it.
+        """
+        key = ("GET", path, tuple(sorted(params.items())))
+        return await self._dedup_get(
+            key, lambda: self._request_json(client, semaphore, path, params, slim)
+        )
+
+    async def _request_json(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        path: str,
+        params: dict,
+        slim: Optional[Callable[[dict], dict]] = None,
+    ):
+        """Issue the GET for _get_json.
+
+        Responses are revalidated with If-None-Match against a stored ETag;
+        a 304 carries no body and doesn't count against the rate limit.
+        """
+        etag_key = f"{path}?{urlencode(sorted(params.items()))}"
+        cached = self._etag_cache.get(etag_key) if self._etag_cache is not None else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        async with semaphore:
+            response = await self._afetch_url(client, path, headers=headers, params=params)
+
+        if response.status_code == 304 and cached:
+            return cached[1]
+        data = _decode_items(response.content, slim) if slim else response.json()
+        etag = response.headers.get("ETag")
+        if etag and self._etag_cache is not None:
+            self._etag_cache.set(etag_key, (etag, data))
+        return data
+
+    async def _search_repos(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        query: str,
+        sort: str = "updated",
+        per_page: int = 30,
+    ) -> list[dict]:
         """Search GitHub repos."""
         try:
-            response = self._fetch_url(
-                "https://api.github.com/search/repositories",
-                headers=self._headers(),
-                params={"q": query, "sort": sort, "order": "desc", "per_page": per_page},
+            data = await self._get_json(
+                client,
+                semaphore,
+                "/search/repositories",
+                {"q": query, "sort": sort, "order": "desc", "per_page": per_page},
             )
-            return response.json().get("items", [])
+            return data.get("items", [])
         except Exception as e:
             logger.warning("github_search_failed", query=query, error=str(e))
             return []
 
-    def _get_org_repos(self, org: str, per_page: int = 30) -> list[dict]:
+    async def _get_org_repos(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        org: str,
+        per_page: int = 30,
+    ) -> list[dict]:
         """Get repos from an organization."""
         try:
-            response = self._fetch_url(
-                f"https://api.github.com/orgs/{org}/repos",
-                headers=self._headers(),
-                params={"sort": "updated", "direction": "desc", "per_page": per_page},
+            data = await self._get_json(
+                client,
+                semaphore,
+                f"/orgs/{org}/repos",
+                {"sort": "updated", "direction": "desc", "per_page": per_page},
             )
-            return response.json() if isinstance(response.json(), list) else []
+            return data if isinstance(data, list) else []
         except Exception as e:
             logger.warning("github_org_fetch_failed", org=org, error=str(e))
             return []
 
-    def _get_repo_commits(self, owner: str, repo: str, since: str, per_page: int = 30) -> list[dict]:
-        """Get recent commits for a repo."""
-        try:
-            response = self._fetch_url(
-                f"https://api.github.com/repos/{owner}/{repo}/commits",
-                headers=self._headers(),
-                params={"since": since, "per_page": per_page},
-            )
-            return response.json() if isinstance(response.json(), list) else []
-        except Exception as e:
-            logger.debug("github_commits_failed", repo=f"{owner}/{repo}", error=str(e))
-            return []
-
-    def _get_repo_releases(self, owner: str, repo: str, per_page: int = 10) -> list[dict]:
+    async def _get_repo_releases(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        owner: str,
+        repo: str,
+        per_page: int = 10,
+    ) -> list[dict]:
         """Get recent releases for a repo."""
         try:
-            response = self._fetch_url(
-                f"https://api.github.com/repos/{owner}/{repo}/releases",
-                headers=self._headers(),
-                params={"per_page": per_page},
+            data = await self._get_json(
+                client,
+                semaphore,
+                f"/repos/{owner}/{repo}/releases",
+                {"per_page": per_page},
+                slim=_slim_release,
             )
-            return response.json() if isinstance(response.json(), list) else []
+            return data if isinstance(data, list) else []
         except Exception as e:
             logger.debug("github_releases_failed", repo=f"{owner}/{repo}", error=str(e))
             return []
 
+    async def _get_releases_graphql(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        repos: list[tuple[str, str]],
+        per_repo: int = 3,
+    ) -> list[list[dict]]:
+        """Fetch recent releases for many repos with one GraphQL call per batch.
+
+        Returns one release list per ``(owner, repo)``, in input order. A batch
+        that fails, or whose response carries GraphQL errors, falls back to
+        per-repo REST calls.
+        """
+
+        async def _batch(chunk: list[tuple[str, str]]) -> list[list[dict]]:
+            variables = {}
+            for i, (owner, repo) in enumerate(chunk):
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = repo
+            payload = {"query": _releases_query(len(chunk), per_repo), "variables": variables}
+            try:
+                async with semaphore:
+                    response = await self._apost_json(client, "/graphql", payload)
+                result = response.json()
+                # GraphQL reports rate limits and access problems in a 200 body
+                if result.get("errors") or not result.get("data"):
+                    messages = [err.get("message", "") for err in result.get("errors") or []]
+                    raise ValueError(f"GraphQL errors: {messages or 'no data'}")
+                data = result["data"]
+            except Exception as e:
+                logger.warning("github_graphql_failed", repos=len(chunk), error=str(e))
+                return await asyncio.gather(
+                    *(
+                        self._get_repo_releases(client, semaphore, owner, repo, per_page=per_repo)
+                        for owner, repo in chunk
+                    )
+                )
+            return [
+                [
+                    _release_from_node(node)
+                    for node in ((data.get(f"r{i}") or {}).get("releases") or {}).get("nodes") or []
+                ]
+                for i in range(len(chunk))
+            ]
+
+        batches = await asyncio.gather(
+            *(
+                _batch(repos[start:start + GRAPHQL_BATCH_SIZE])
+                for start in range(0, len(repos), GRAPHQL_BATCH_SIZE)
+            )
+        )
+        return [releases for batch in batches for releases in batch]
+
     def fetch(self, window_start: datetime, window_end: datetime) -> list[SignalEvent]:
         """Fetch GitHub activity signals."""
         cache_key = f"github_{window_start.date()}_{window_end.date()}"
         cached = self._get_cached(cache_key)
         if cached:
-            return [SignalEvent.from_dict(e) for e in cached]
+            return cached
 
-        events = []
         logger.info("fetching_github_data", window_start=window_start.isoformat())
+        events = run_async(self._fetch_async(window_start))
 
-        # 1. Search for recently updated/created Solana repos
-        for query in self.search_queries[:4]:  # Limit queries to avoid rate limiting
-            full_query = f"{query} pushed:>{window_start.strftime('%Y-%m-%d')}"
-            repos = self._search_repos(full_query, per_page=15)
-
-            for repo in repos:
-                created_at = datetime.fromisoformat(repo["created_at"].replace("Z", "+00:00"))
-                updated_at = datetime.fromisoformat(repo["updated_at"].replace("Z", "+00:00"))
-                stars = repo.get("stargazers_count", 0)
-                forks = repo.get("forks_count", 0)
-                name = repo.get("full_name", "")
-                desc = repo.get("description", "") or ""
-                language = repo.get("language", "unknown")
-
-                # Extract entities from repo name and description
-                entities = self._extract_entities(name, desc)
-
-                # New repo creation signal
-                if created_at >= window_start.replace(tzinfo=timezone.utc):
-                    events.append(
-                        SignalEvent(
-                            timestamp=created_at,
-                            source_type=SourceType.OFFCHAIN,
-                            source_subtype=SourceSubtype.GITHUB,
-                            entities=entities,
-                            text=f"New Solana repo created: {name} - {desc[:200]}. Language: {language}.",
-                            url=repo.get("html_url", ""),
-                            metrics={
-                                "stars": stars,
-                                "forks": forks,
-                                "language": language,
-                                "is_new": True,
-                            },
-                            raw_source=f"github:search:{query}",
-                            author=repo.get("owner", {}).get("login", ""),
-                        )
-                    )
-                elif stars > 10:
-                    events.append(
-                        SignalEvent(
-                            timestamp=updated_at,
-                            source_type=SourceType.OFFCHAIN,
-                            source_subtype=SourceSubtype.GITHUB,
-                            entities=entities,
-                            text=f"Active Solana repo: {name} ({stars} stars, {forks} forks) - {desc[:200]}. Language: {language}.",
-                            url=repo.get("html_url", ""),
-                            metrics={
-                                "stars": stars,
-                                "forks": forks,
-                                "language": language,
-                                "is_new": False,
-                            },
-                            raw_source=f"github:search:{query}",
-                            author=repo.get("owner", {}).get("login", ""),
-                        )
-                    )
-
-        # 2. Check key orgs for activity
-        for org in self.orgs[:6]:  # Limit to avoid rate limiting
-            repos = self._get_org_repos(org, per_page=10)
-            for repo in repos:
-                updated_at_str = repo.get("updated_at", "")
-                if not updated_at_str:
-                    continue
-                updated_at = datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
-                if updated_at < window_start.replace(tzinfo=timezone.utc):
-                    continue
-
-                name = repo.get("full_name", "")
-                desc = repo.get("description", "") or ""
-                stars = repo.get("stargazers_count", 0)
-
-                # Check for releases
-                owner_name = repo.get("owner", {}).get("login", org)
-                repo_name = repo.get("name", "")
-                releases = self._get_repo_releases(owner_name, repo_name, per_page=3)
+        if events:
+            self._set_cached(cache_key, events)
+        else:
+            logger.warning("github_fetch_empty", reason="No GitHub data, loading snapshot")
+            events = self._load_snapshot_fallback()
 
-                for release in releases:
-                    pub_date_str = release.get("published_at", "")
-                    if not pub_date_str:
-                        continue
-                    pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
-                    if pub_date >= window_start.replace(tzinfo=timezone.utc):
-                        tag = release.get("tag_name", "")
-                        release_name = release.get("name", tag)
-                        body = (release.get("body", "") or "")[:300]
-                        entities = self._extract_entities(name, f"{release_name} {body}")
+        logger.info("github_fetch_complete", event_count=len(events))
+        return events
 
+    async def _fetch_async(self, window_start: datetime) -> list[SignalEvent]:
+        """Fan out search, org and release requests concurrently."""
+        events = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        window_start_utc = window_start.replace(tzinfo=timezone.utc)
+        # Enum members as locals: the event loops below look them up per event
+        offchain, github = SourceType.OFFCHAIN, SourceSubtype.GITHUB
+        queries = self.search_queries[:4]  # Limit queries to avoid rate limiting
+        orgs = self.orgs[:6]  # Limit to avoid rate limiting
+
+        async with self._async_client() as client:
+            # Wave 1: repo searches and org listings are independent
+            results = await asyncio.gather(
+                *(
+                    self._search_repos(
+                        client,
+                        semaphore,
+                        f"{query} pushed:>{window_start.strftime('%Y-%m-%d')}",
+                        per_page=15,
+                    )
+                    for query in queries
+                ),
+                *(self._get_org_repos(client, semaphore, org, per_page=10) for org in orgs),
+            )
+            search_results = results[: len(queries)]
+            org_results = results[len(queries):]
+
+            # 1. Search for recently updated/created Solana repos
+            for query, repos in zip(queries, search_results):
+                for repo in repos:
+                    created_at = parse_iso_timestamp(repo["created_at"])
+                    updated_at = parse_iso_timestamp(repo["updated_at"])
+                    stars = repo.get("stargazers_count", 0)
+                    forks = repo.get("forks_count", 0)
+                    name = repo.get("full_name", "")
+                    desc = repo.get("description", "") or ""
+                    language = repo.get("language", "unknown")
+
+                    # Extract entities from repo name and description
+                    entities = self._extract_entities(name, desc)
+
+                    # New repo creation signal
+                    if created_at >= window_start_utc:
                         events.append(
                             SignalEvent(
-                                timestamp=pub_date,
-                                source_type=SourceType.OFFCHAIN,
-                                source_subtype=SourceSubtype.GITHUB,
+                                timestamp=created_at,
+                                source_type=offchain,
+                                source_subtype=github,
                                 entities=entities,
-                                text=f"New release for {name}: {release_name} ({tag}). {body}",
-                                url=release.get("html_url", ""),
+                                text=f"New Solana repo created: {name} - {desc[:200]}. Language: {language}.",
+                                url=repo.get("html_url", ""),
                                 metrics={
                                     "stars": stars,
-                                    "is_release": True,
-                                    "tag": tag,
+                                    "forks": forks,
+                                    "language": language,
+                                    "is_new": True,
                                 },
-                                raw_source=f"github:release:{name}",
-                                author=release.get("author", {}).get("login", ""),
+                                raw_source=f"github:search:{query}",
+                                author=repo.get("owner", {}).get("login", ""),
+                            )
+                        )
+                    elif stars > 10:
+                        events.append(
+                            SignalEvent(
+                                timestamp=updated_at,
+                                source_type=offchain,
+                                source_subtype=github,
+                                entities=entities,
+                                text=f"Active Solana repo: {name} ({stars} stars, {forks} forks) - {desc[:200]}. Language: {language}.",
+                                url=repo.get("html_url", ""),
+                                metrics={
+                                    "stars": stars,
+                                    "forks": forks,
+                                    "language": language,
+                                    "is_new": False,
+                                },
+                                raw_source=f"github:search:{query}",
+                                author=repo.get("owner", {}).get("login", ""),
                             )
                         )
 
-        if events:
-            self._set_cached(cache_key, [e.to_dict() for e in events])
-        else:
-            logger.warning("github_fetch_empty", reason="No GitHub data, loading snapshot")
-            events = self._load_snapshot_fallback()
+            # 2. Check key orgs for activity
+            active_repos = []
+            for org, repos in zip(orgs, org_results):
+                for repo in repos:
+                    updated_at_str = repo.get("updated_at", "")
+                    if not updated_at_str:
+                        continue
+                    updated_at = parse_iso_timestamp(updated_at_str)
+                    if updated_at < window_start_utc:
+                        continue
+                    active_repos.append((org, repo))
+
+            # Wave 2: releases for every active org repo
+            repo_keys = [
+                (repo.get("owner", {}).get("login", org), repo.get("name", ""))
+                for org, repo in active_repos
+            ]
+            if self.token:
+                # GraphQL needs auth, but batches all repos into a few POSTs
+                all_releases = await self._get_releases_graphql(
+                    client, semaphore, repo_keys, per_repo=3
+                )
+            else:
+                all_releases = await asyncio.gather(
+                    *(
+                        self._get_repo_releases(client, semaphore, owner, name, per_page=3)
+                        for owner, name in repo_keys
+                    )
+                )
+
+        for (org, repo), releases in zip(active_repos, all_releases):
+            name = repo.get("full_name", "")
+            stars = repo.get("stargazers_count", 0)
+
+            for release in releases:
+                pub_date_str = release.get("published_at", "")
+                if not pub_date_str:
+                    continue
+                pub_date = parse_iso_timestamp(pub_date_str)
+                if pub_date >= window_start_utc:
+                    tag = release.get("tag_name", "")
+                    release_name = release.get("name", tag)
+                    body = (release.get("body", "") or "")[:300]
+                    entities = self._extract_entities(name, f"{release_name} {body}")
+
+                    events.append(
+                        SignalEvent(
+                            timestamp=pub_date,
+                            source_type=offchain,
+                            source_subtype=github,
+                            entities=entities,
+                            text=f"New release for {name}: {release_name} ({tag}). {body}",
+                            url=release.get("html_url", ""),
+                            metrics={
+                                "stars": stars,
+                                "is_release": True,
+                                "tag": tag,
+                            },
+                            raw_source=f"github:release:{name}",
+                            author=release.get("author", {}).get("login", ""),
+                        )
+                    )
 
-        logger.info("github_fetch_complete", event_count=len(events))
         return events
 
+    def close(self):
+        super().close()
+        if self._etag_cache is not None:
+            self._etag_cache.close()
+
     def _extract_entities(self, name: str, description: str) -> list[str]:
         """Extract entity names from repo info."""
-        entities = []
         text = f"{name} {description}".lower()
-
-        known_entities = {
-            "anchor": ["anchor"],
-            "metaplex": ["metaplex"],
-            "jupiter": ["jupiter", "jup"],
-            "marinade": ["marinade", "msol"],
-            "jito": ["jito"],
-            "drift": ["drift"],
-            "tensor": ["tensor"],
-            "helius": ["helius"],
-            "orca": ["orca", "whirlpool"],
-            "raydium": ["raydium"],
-            "phantom": ["phantom"],
-            "squads": ["squads"],
-            "helium": ["helium", "hnt"],
-            "compressed-nft": ["compressed nft", "cnft", "state compression", "bubblegum"],
-            "token-extensions": ["token-2022", "token extensions", "token22"],
-            "blinks": ["blinks", "solana actions"],
-            "solana-mobile": ["solana mobile", "saga"],
-            "solana-pay": ["solana pay"],
-            "depin": ["depin", "decentralized physical"],
-            "ai-agents": ["ai agent", "solana ai", "ai crypto"],
-            "mev": ["mev", "sandwich", "jito tip"],
-            "validator": ["validator", "stake pool"],
-            "svm": ["svm", "solana virtual machine", "neon evm", "eclipse"],
-        }
-
-        for entity, keywords in known_entities.items():
-            for kw in keywords:
-                if kw in text:
-                    entities.append(entity)
-                    break
+        # dict keys give order-preserving dedup as entities are added
+        entities = dict.fromkeys(_ENTITY_MATCHER.match(text))
 
         # Also add the org/repo name
         if "/" in name:
             org = name.split("/")[0].lower()
-            entities.append(org)
+            entities[org] = None
 
-        return list(set(entities)) if entities else ["solana-ecosystem"]
+        return list(entities) or ["solana-ecosystem"]
 
     def _load_snapshot_fallback(self) -> list[SignalEvent]:
         """Load bundled snapshot."""
         snapshot_path = Path("data/snapshots/github_snapshot.json")
         if snapshot_path.exists():
-            data = json.loads(snapshot_path.read_text())
-            return [SignalEvent.from_dict(e) for e in data]
+            return decode_events(snapshot_path.read_bytes())
         return []
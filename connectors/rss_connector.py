@@ -6,21 +6,32 @@ This is the most reliable offchain connector as it doesn't require API keys.
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-import feedparser
-from dateutil import parser as dateparser
+import diskcache
 
-from connectors.base import BaseConnector
-from pipeline.models import SignalEvent, SourceType, SourceSubtype
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - regex fallback below
+    LexborHTMLParser = None
+
+from connectors.base import BaseConnector, CACHE_DIR
+from connectors.dates import parse_feed_date
+from connectors.feeds import fetch_feed_entries
+from connectors.entities import EntityMatcher, RSS_ENTITY_KEYWORDS
+from pipeline.models import SignalEvent, SourceType, SourceSubtype, decode_events
 from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_ENTITY_MATCHER = EntityMatcher(RSS_ENTITY_KEYWORDS)
+
 # Default feeds if config is missing
 DEFAULT_FEEDS = [
     {"url": "https://solana.com/news/rss.xml", "name": "Solana Foundation", "category": "official"},
@@ -43,23 +54,26 @@ class RSSConnector(BaseConnector):
         super().__init__(config, cache_enabled)
         rss_config = config.get("sources", {}).get("offchain", {}).get("rss_blogs", {})
         self.feeds = rss_config.get("feeds", DEFAULT_FEEDS)
-
-    def _parse_feed(self, feed_info: dict, window_start: datetime) -> list[SignalEvent]:
-        """Parse a single RSS feed into signal events."""
+        # url -> ETag, Last-Modified and parsed entries for conditional GETs, kept across runs
+        self._feed_state = (
+            diskcache.Cache(str(CACHE_DIR / "rss_feed_state")) if cache_enabled else None
+        )
+
+    def _parse_feed(
+        self, feed_info: dict, entries: Optional[list], window_start: datetime
+    ) -> list[SignalEvent]:
+        """Turn a feed's parsed entries into signal events."""
         events = []
         url = feed_info["url"]
         feed_name = feed_info.get("name", url)
         category = feed_info.get("category", "blog")
 
-        try:
-            self._rate_limit()
-            feed = feedparser.parse(url)
+        if entries is None:
+            logger.warning("rss_feed_error", feed=feed_name, error="download failed")
+            return []
 
-            if feed.bozo and not feed.entries:
-                logger.warning("rss_parse_error", feed=feed_name, url=url)
-                return []
-
-            for entry in feed.entries[:20]:
+        try:
+            for entry in entries:
                 # Parse date
                 pub_date = self._parse_entry_date(entry)
                 if not pub_date:
@@ -108,7 +122,7 @@ class RSSConnector(BaseConnector):
         for field in ["published", "updated", "date"]:
             if field in entry and entry[field]:
                 try:
-                    return dateparser.parse(entry[field])
+                    return parse_feed_date(entry[field])
                 except Exception:
                     continue
 
@@ -116,69 +130,39 @@ class RSSConnector(BaseConnector):
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags from text."""
-        clean = re.sub(r"<[^>]+>", " ", text)
-        clean = re.sub(r"\s+", " ", clean).strip()
-        return clean
+        if LexborHTMLParser is not None:
+            # Single C-level parse; also decodes entities like &amp;
+            clean = LexborHTMLParser(text).text(separator=" ")
+        else:
+            clean = _TAG_RE.sub(" ", text)
+        return _WS_RE.sub(" ", clean).strip()
 
     def _extract_entities(self, text: str) -> list[str]:
         """Extract known entities from text."""
-        entities = []
-        text_lower = text.lower()
-
-        entity_keywords = {
-            "jupiter": ["jupiter", "jup aggregator"],
-            "marinade": ["marinade", "msol", "mnde"],
-            "jito": ["jito", "jitosol", "mev on solana"],
-            "drift": ["drift protocol", "drift exchange"],
-            "tensor": ["tensor", "nft marketplace"],
-            "helius": ["helius", "rpc provider"],
-            "orca": ["orca", "whirlpool"],
-            "raydium": ["raydium"],
-            "metaplex": ["metaplex"],
-            "compressed-nft": ["compressed nft", "cnft", "state compression"],
-            "token-extensions": ["token-2022", "token extensions", "token22"],
-            "blinks": ["blinks", "blockchain links", "solana actions"],
-            "depin": ["depin", "decentralized physical infrastructure"],
-            "solana-mobile": ["solana mobile", "saga phone", "chapter 2"],
-            "ai-agents": ["ai agent", "artificial intelligence", "machine learning", "llm"],
-            "mev": ["mev", "maximal extractable value", "sandwich attack"],
-            "validator": ["validator", "stake pool", "staking"],
-            "svm": ["svm", "solana virtual machine"],
-            "firedancer": ["firedancer", "frankendancer", "jump crypto validator"],
-            "grpc": ["grpc", "geyser", "yellowstone"],
-            "solana-pay": ["solana pay"],
-            "nft": ["nft", "digital collectible"],
-            "defi": ["defi", "decentralized finance", "lending", "borrowing"],
-            "payments": ["payments", "point of sale", "checkout"],
-            "gaming": ["gaming", "game", "play to earn"],
-            "dao": ["dao", "governance", "multisig"],
-        }
-
-        for entity, keywords in entity_keywords.items():
-            for kw in keywords:
-                if kw in text_lower:
-                    entities.append(entity)
-                    break
-
-        return list(set(entities)) if entities else ["solana-ecosystem"]
+        # Matches are already unique and in table order
+        return _ENTITY_MATCHER.match(text.lower()) or ["solana-ecosystem"]
 
     def fetch(self, window_start: datetime, window_end: datetime) -> list[SignalEvent]:
         """Fetch RSS/blog signals."""
         cache_key = f"rss_{window_start.date()}_{window_end.date()}"
         cached = self._get_cached(cache_key)
         if cached:
-            return [SignalEvent.from_dict(e) for e in cached]
+            return cached
 
         events = []
         logger.info("fetching_rss_data", feed_count=len(self.feeds))
 
-        for feed_info in self.feeds:
-            feed_events = self._parse_feed(feed_info, window_start)
+        # Download every feed concurrently, then build events in feed order
+        all_entries = fetch_feed_entries(
+            self, [feed_info["url"] for feed_info in self.feeds], self._feed_state, max_entries=20
+        )
+        for feed_info, entries in zip(self.feeds, all_entries):
+            feed_events = self._parse_feed(feed_info, entries, window_start)
             events.extend(feed_events)
             logger.info("rss_feed_parsed", feed=feed_info.get("name", ""), events=len(feed_events))
 
         if events:
-            self._set_cached(cache_key, [e.to_dict() for e in events])
+            self._set_cached(cache_key, events)
         else:
             logger.warning("rss_fetch_empty", reason="No RSS data, loading snapshot")
             events = self._load_snapshot_fallback()
@@ -186,10 +170,14 @@ class RSSConnector(BaseConnector):
         logger.info("rss_fetch_complete", event_count=len(events))
         return events
 
+    def close(self):
+        super().close()
+        if self._feed_state is not None:
+            self._feed_state.close()
+
     def _load_snapshot_fallback(self) -> list[SignalEvent]:
         """Load bundled snapshot."""
         snapshot_path = Path("data/snapshots/rss_snapshot.json")
         if snapshot_path.exists():
-            data = json.loads(snapshot_path.read_text())
-            return [SignalEvent.from_dict(e) for e in data]
+            return decode_events(snapshot_path.read_bytes())
         return []
@@ -6,16 +6,16 @@ Falls back to bundled snapshot data if RPC is unavailable.
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional
 
-import httpx
+import orjson
 
 from connectors.base import BaseConnector
-from pipeline.models import SignalEvent, SourceType, SourceSubtype
+from connectors.circuit import breaker_for
+from pipeline.models import SignalEvent, SourceType, SourceSubtype, decode_events
 from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +38,9 @@ TRACKED_PROGRAMS = {
     "Vote111111111111111111111111111111111111111": "Vote Program",
 }
 
+# Most RPC providers cap JSON-RPC batches at around 100 requests
+RPC_BATCH_LIMIT = 100
+
 
 class SolanaOnchainConnector(BaseConnector):
     """Connector for Solana onchain data via RPC."""
@@ -53,7 +56,10 @@ class SolanaOnchainConnector(BaseConnector):
 
     def _rpc_call(self, method: str, params: list = None) -> dict:
         """Make a Solana RPC call."""
-        self._rate_limit()
+        breaker = breaker_for(self.rpc_url)
+        if not breaker.allow():
+            logger.warning("rpc_circuit_open", method=method)
+            return {}
         payload = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -61,74 +67,105 @@ class SolanaOnchainConnector(BaseConnector):
             "params": params or [],
         }
         try:
-            response = self._client.post(
+            response = self._request(
+                "POST",
                 self.rpc_url,
-                json=payload,
+                content=orjson.dumps(payload),
                 headers={"Content-Type": "application/json"},
             )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                logger.warning("rpc_error", method=method, error=result["error"])
-                return {}
-            return result.get("result", {})
+            result = orjson.loads(response.content)
         except Exception as e:
+            breaker.record_failure()
             logger.warning("rpc_call_failed", method=method, error=str(e))
             return {}
+        breaker.record_success()
+        if "error" in result:
+            logger.warning("rpc_error", method=method, error=result["error"])
+            return {}
+        return result.get("result", {})
 
-    def _fetch_recent_performance(self) -> list[dict]:
-        """Get recent performance samples for tx activity."""
-        result = self._rpc_call("getRecentPerformanceSamples", [10])
-        return result if isinstance(result, list) else []
+    def _rpc_batch(self, calls: list[tuple[str, list]]) -> list:
+        """Send several RPC calls as JSON-RPC batches, one POST per RPC_BATCH_LIMIT calls.
 
-    def _fetch_epoch_info(self) -> dict:
-        """Get current epoch info."""
-        return self._rpc_call("getEpochInfo")
+        Results come back in call order; a failed call yields ``{}`` like
+        _rpc_call. If the endpoint rejects batches, the calls are retried one
+        by one.
+        """
+        results: list = []
+        breaker = breaker_for(self.rpc_url)
+        for start in range(0, len(calls), RPC_BATCH_LIMIT):
+            chunk = calls[start:start + RPC_BATCH_LIMIT]
+            if not breaker.allow():
+                logger.warning("rpc_circuit_open", calls=len(chunk))
+                results.extend({} for _ in chunk)
+                continue
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            try:
+                response = self._request(
+                    "POST",
+                    self.rpc_url,
+                    content=orjson.dumps(payload),
+                    headers={"Content-Type": "application/json"},
+                )
+                replies = orjson.loads(response.content)
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning("rpc_batch_failed", calls=len(chunk), error=str(e))
+                results.extend({} for _ in chunk)
+                continue
+            breaker.record_success()
 
-    def _fetch_supply(self) -> dict:
-        """Get current SOL supply info."""
-        return self._rpc_call("getSupply")
+            if not isinstance(replies, list):
+                logger.warning("rpc_batch_unsupported", endpoint=self.rpc_url)
+                results.extend(self._rpc_call(method, params) for method, params in chunk)
+                continue
 
-    def _fetch_program_accounts_count(self, program_id: str) -> int:
-        """Get number of accounts for a program (proxy for usage)."""
-        try:
-            result = self._rpc_call(
-                "getProgramAccounts",
-                [program_id, {"encoding": "base64", "dataSlice": {"offset": 0, "length": 0}}],
-            )
-            if isinstance(result, list):
-                return len(result)
-        except Exception:
-            pass
-        return 0
-
-    def _fetch_slot_leaders(self) -> list[str]:
-        """Get recent slot leaders for validator activity."""
-        try:
-            epoch = self._fetch_epoch_info()
-            current_slot = epoch.get("absoluteSlot", 0)
-            if current_slot > 0:
-                result = self._rpc_call("getSlotLeaders", [current_slot - 10, 10])
-                return result if isinstance(result, list) else []
-        except Exception:
-            pass
-        return []
+            # Replies may arrive in any order; match them back up by id
+            by_id = {reply.get("id"): reply for reply in replies if isinstance(reply, dict)}
+            for i, (method, _) in enumerate(chunk):
+                reply = by_id.get(i, {})
+                if "error" in reply:
+                    logger.warning("rpc_error", method=method, error=reply["error"])
+                    results.append({})
+                else:
+                    results.append(reply.get("result", {}))
+        return results
 
     def fetch(self, window_start: datetime, window_end: datetime) -> list[SignalEvent]:
         """Fetch onchain signals from Solana."""
         cache_key = f"onchain_{window_start.date()}_{window_end.date()}"
         cached = self._get_cached(cache_key)
         if cached:
-            return [SignalEvent.from_dict(e) for e in cached]
+            return cached
 
         events = []
         logger.info("fetching_onchain_data", window_start=window_start.isoformat(), window_end=window_end.isoformat())
 
+        # Every read below is independent, so send them as one JSON-RPC batch
+        programs = list(islice(TRACKED_PROGRAMS.items(), 8))
+        results = self._rpc_batch(
+            [
+                ("getRecentPerformanceSamples", [10]),
+                ("getEpochInfo", []),
+                ("getSupply", []),
+                *(("getBalance", [program_id]) for program_id, _ in programs),
+            ]
+        )
+        perf_samples, epoch_info, supply = results[:3]
+        balances = results[3:]
+
         # 1. Get performance metrics
-        perf_samples = self._fetch_recent_performance()
+        if not isinstance(perf_samples, list):
+            perf_samples = []
         if perf_samples:
-            total_txs = sum(s.get("numTransactions", 0) for s in perf_samples)
-            avg_tps = total_txs / max(1, sum(s.get("samplePeriodSecs", 60) for s in perf_samples))
+            total_txs = total_secs = 0
+            for sample in perf_samples:
+                total_txs += sample.get("numTransactions", 0)
+                total_secs += sample.get("samplePeriodSecs", 60)
+            avg_tps = total_txs / max(1, total_secs)
             events.append(
                 SignalEvent(
                     timestamp=window_end,
@@ -146,7 +183,6 @@ class SolanaOnchainConnector(BaseConnector):
             )
 
         # 2. Get epoch info
-        epoch_info = self._fetch_epoch_info()
         if epoch_info:
             epoch = epoch_info.get("epoch", 0)
             slot_index = epoch_info.get("slotIndex", 0)
@@ -169,11 +205,10 @@ class SolanaOnchainConnector(BaseConnector):
             )
 
         # 3. Probe known programs for activity signals
-        for program_id, program_name in list(TRACKED_PROGRAMS.items())[:8]:
+        for (program_id, program_name), result in zip(programs, balances):
             # We use a lightweight heuristic: getBalance on the program address
             # to see if it exists and is active, combined with known ecosystem info
             try:
-                result = self._rpc_call("getBalance", [program_id])
                 if result and isinstance(result, dict):
                     balance = result.get("value", 0)
                     events.append(
@@ -192,7 +227,6 @@ class SolanaOnchainConnector(BaseConnector):
                 logger.debug("program_probe_failed", program=program_name, error=str(e))
 
         # 4. Supply metrics
-        supply = self._fetch_supply()
         if supply and isinstance(supply, dict) and "value" in supply:
             val = supply["value"]
             total = val.get("total", 0) / 1e9
@@ -214,7 +248,7 @@ class SolanaOnchainConnector(BaseConnector):
             )
 
         if events:
-            self._set_cached(cache_key, [e.to_dict() for e in events])
+            self._set_cached(cache_key, events)
             logger.info("onchain_fetch_complete", event_count=len(events))
         else:
             logger.warning("onchain_fetch_empty", reason="No data from RPC, will use snapshot fallback")
@@ -226,7 +260,7 @@ class SolanaOnchainConnector(BaseConnector):
         """Load bundled snapshot data as fallback."""
         snapshot_path = Path("data/snapshots/onchain_snapshot.json")
         if snapshot_path.exists():
-            data = json.loads(snapshot_path.read_text())
-            logger.info("loaded_snapshot_fallback", source="onchain", count=len(data))
-            return [SignalEvent.from_dict(e) for e in data]
+            events = decode_events(snapshot_path.read_bytes())
+            logger.info("loaded_snapshot_fallback", source="onchain", count=len(events))
+            return events
         return []
@@ -6,22 +6,38 @@ Falls back to Nitter RSS or bundled data if API key unavailable.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import re
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
-import feedparser
-from dateutil import parser as dateparser
+import diskcache
+import httpx
+import orjson
 
-from connectors.base import BaseConnector
-from pipeline.models import SignalEvent, SourceType, SourceSubtype
+from connectors.base import BaseConnector, CACHE_DIR, run_async
+from connectors.circuit import OPEN, breaker_for
+from connectors.dates import parse_feed_date
+from connectors.feeds import fetch_feed_entries
+from connectors.entities import EntityMatcher, TWITTER_ENTITY_KEYWORDS
+from pipeline.models import SignalEvent, SourceType, SourceSubtype, decode_events
 from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_ENTITY_MATCHER = EntityMatcher(TWITTER_ENTITY_KEYWORDS)
+
+# Entity scan budget: comfortably past the 500 chars an event keeps, so long
+# threads don't cost a lowercase copy and scan of several KB each
+ENTITY_SCAN_CHARS = 1024
+
 # Nitter instances for RSS fallback
 NITTER_INSTANCES = [
     "https://nitter.privacydev.net",
@@ -29,6 +45,20 @@ NITTER_INSTANCES = [
     "https://nitter.woodland.cafe",
 ]
 
+# Single-flight state for the Nitter probe: concurrent connectors share one
+# probe and its answer. A healthy instance is remembered for NITTER_PROBE_TTL
+# seconds, and kept on disk for that long so later runs skip the probe. "All
+# instances down" is only remembered for NITTER_DOWN_TTL, so one bad probe
+# doesn't switch Twitter off for an hour in a long-running process.
+NITTER_PROBE_TTL = 3600.0
+NITTER_DOWN_TTL = 60.0
+# How long a caller waits on another thread's probe (each probe times out at 5s)
+NITTER_PROBE_WAIT = 15.0
+# Guards the two globals below; never held while probing
+_nitter_probe_lock = threading.Lock()
+_nitter_probe: Optional[tuple[float, Optional[str]]] = None  # (probed_at, instance)
+_nitter_probing: Optional[threading.Event] = None  # set when the running probe ends
+
 
 class TwitterConnector(BaseConnector):
     """Connector for Twitter/X social signals."""
@@ -43,20 +73,100 @@ class TwitterConnector(BaseConnector):
         self.kol_handles = tw_config.get("kol_handles", [])
         self.keyword_queries = tw_config.get("keyword_queries", ["solana"])
         self._nitter_base = None
+        # The healthy instance and the feeds' ETag state live in separate stores
+        self._nitter_state = (
+            diskcache.Cache(str(CACHE_DIR / "nitter_state")) if cache_enabled else None
+        )
+        self._feed_state = (
+            diskcache.Cache(str(CACHE_DIR / "nitter_feeds")) if cache_enabled else None
+        )
+        # Tweets keyed individually, so overlapping windows share them
+        self._event_store = (
+            diskcache.Cache(str(CACHE_DIR / "twitter_events")) if cache_enabled else None
+        )
 
     def _find_working_nitter(self) -> Optional[str]:
         """Find a working Nitter instance."""
+        global _nitter_probe
         if self._nitter_base:
             return self._nitter_base
-        for instance in NITTER_INSTANCES:
-            try:
-                resp = self._client.get(f"{instance}/", timeout=5.0)
-                if resp.status_code < 400:
-                    self._nitter_base = instance
-                    return instance
-            except Exception:
-                continue
-        return None
+        with _nitter_probe_lock:
+            probe = _nitter_probe
+        fresh = False
+        instance = None
+        if probe is not None:
+            probed_at, instance = probe
+            ttl = NITTER_PROBE_TTL if instance else NITTER_DOWN_TTL
+            fresh = time.monotonic() - probed_at < ttl
+        if not fresh:
+            instance = self._nitter_state.get("instance") if self._nitter_state is not None else None
+            if instance is None:
+                instance = self._shared_probe()
+            else:
+                with _nitter_probe_lock:
+                    _nitter_probe = (time.monotonic(), instance)
+        if instance and breaker_for(instance).state == OPEN:
+            # The remembered instance has been failing since; probe again
+            self._forget_nitter()
+            instance = self._shared_probe()
+        self._nitter_base = instance
+        return self._nitter_base
+
+    def _shared_probe(self) -> Optional[str]:
+        """Probe Nitter once across threads; callers arriving mid-probe wait for its answer."""
+        global _nitter_probe, _nitter_probing
+        with _nitter_probe_lock:
+            probing = _nitter_probing
+            owner = probing is None
+            if owner:
+                probing = _nitter_probing = threading.Event()
+        if not owner:
+            probing.wait(NITTER_PROBE_WAIT)
+            with _nitter_probe_lock:
+                return _nitter_probe[1] if _nitter_probe else None
+
+        instance = None
+        try:
+            instance = run_async(self._aprobe_nitter())
+        finally:
+            with _nitter_probe_lock:
+                _nitter_probe = (time.monotonic(), instance)
+                _nitter_probing = None
+            probing.set()
+        if instance and self._nitter_state is not None:
+            self._nitter_state.set("instance", instance, expire=NITTER_PROBE_TTL)
+        return instance
+
+    def _forget_nitter(self):
+        """Drop the remembered Nitter instance, in memory and on disk."""
+        global _nitter_probe
+        with _nitter_probe_lock:
+            _nitter_probe = None
+        self._nitter_base = None
+        if self._nitter_state is not None:
+            self._nitter_state.delete("instance")
+
+    async def _aprobe_nitter(self) -> Optional[str]:
+        """Probe every Nitter instance at once; first healthy one in list order wins."""
+        async with self._async_client() as client:
+
+            async def _probe(instance: str) -> bool:
+                breaker = breaker_for(instance)
+                if not breaker.allow():
+                    return False
+                try:
+                    resp = await client.get(f"{instance}/", timeout=5.0)
+                except Exception:
+                    breaker.record_failure()
+                    return False
+                if resp.status_code >= 500:
+                    breaker.record_failure()
+                    return False
+                breaker.record_success()
+                return resp.status_code < 400
+
+            healthy = await asyncio.gather(*(_probe(instance) for instance in NITTER_INSTANCES))
+        return next((i for i, ok in zip(NITTER_INSTANCES, healthy) if ok), None)
 
     def _fetch_via_api(self, window_start: datetime) -> list[SignalEvent]:
         """Fetch tweets via official Twitter API v2."""
@@ -66,7 +176,6 @@ class TwitterConnector(BaseConnector):
         # Search recent tweets for keywords
         for query in self.keyword_queries[:3]:
             try:
-                self._rate_limit()
                 params = {
                     "query": f"{query} -is:retweet lang:en",
                     "max_results": 20,
@@ -75,13 +184,18 @@ class TwitterConnector(BaseConnector):
                     "user.fields": "username,public_metrics",
                     "start_time": window_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
                 }
-                response = self._client.get(
-                    "https://api.twitter.com/2/tweets/search/recent",
-                    headers=headers,
-                    params=params,
-                )
+                try:
+                    response = self._request(
+                        "GET",
+                        "https://api.twitter.com/2/tweets/search/recent",
+                        headers=headers,
+                        params=params,
+                    )
+                except httpx.HTTPStatusError as e:
+                    # Permanent, or still failing after the transient retries
+                    response = e.response
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     tweets = data.get("data", [])
                     users = {
                         u["id"]: u
@@ -132,6 +246,19 @@ class TwitterConnector(BaseConnector):
 
         return events
 
+    def _fetch_nitter_feeds(self, nitter_base: str, handles: list[str]) -> list[Optional[list]]:
+        """Latest entries per handle; unchanged feeds are served from their stored parse."""
+        urls = [f"{nitter_base}/{handle}/rss" for handle in handles]
+        all_entries = fetch_feed_entries(self, urls, self._feed_state, max_entries=5)
+        # Feed outcomes, not just health probes, decide when the instance is dead
+        breaker = breaker_for(nitter_base)
+        for entries in all_entries:
+            if entries is None:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return all_entries
+
     def _fetch_via_nitter(self, window_start: datetime) -> list[SignalEvent]:
         """Fetch tweets via Nitter RSS as fallback."""
         events = []
@@ -141,14 +268,23 @@ class TwitterConnector(BaseConnector):
             logger.warning("no_nitter_available", reason="All Nitter instances down")
             return []
 
-        # Fetch KOL account feeds
-        for handle in self.kol_handles[:15]:
+        # Download KOL account feeds over the pooled client, then parse the bodies;
+        # feedparser.parse(url) would open a fresh urllib connection per feed
+        handles = self.kol_handles[:15]
+        all_entries = self._fetch_nitter_feeds(nitter_base, handles)
+        if handles and all(entries is None for entries in all_entries):
+            # Every feed failed: the remembered instance has gone bad
+            logger.warning("nitter_instance_failed", instance=nitter_base)
+            self._forget_nitter()
+            retry_base = self._find_working_nitter()
+            if retry_base and retry_base != nitter_base:
+                all_entries = self._fetch_nitter_feeds(retry_base, handles)
+        for handle, entries in zip(handles, all_entries):
+            if entries is None:
+                logger.debug("nitter_feed_error", handle=handle, error="download failed")
+                continue
             try:
-                self._rate_limit()
-                feed_url = f"{nitter_base}/{handle}/rss"
-                feed = feedparser.parse(feed_url)
-
-                for entry in feed.entries[:5]:
+                for entry in entries:
                     pub_date = self._parse_date(entry)
                     if not pub_date:
                         continue
@@ -182,70 +318,32 @@ class TwitterConnector(BaseConnector):
         """Parse date from feed entry."""
         for field in ["published_parsed", "updated_parsed"]:
             if hasattr(entry, field) and getattr(entry, field):
-                import time
                 ts = time.mktime(getattr(entry, field))
                 return datetime.fromtimestamp(ts, tz=timezone.utc)
         for field in ["published", "updated"]:
             if field in entry:
                 try:
-                    return dateparser.parse(entry[field])
+                    return parse_feed_date(entry[field])
                 except Exception:
                     continue
         return None
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags."""
-        clean = re.sub(r"<[^>]+>", " ", text)
-        return re.sub(r"\s+", " ", clean).strip()
+        return _WS_RE.sub(" ", _TAG_RE.sub(" ", text)).strip()
 
     def _extract_entities(self, text: str) -> list[str]:
         """Extract entities from tweet text."""
-        entities = []
-        text_lower = text.lower()
-
-        entity_keywords = {
-            "jupiter": ["jupiter", "@jupiterexchange", "jup"],
-            "marinade": ["marinade", "msol", "mnde"],
-            "jito": ["jito", "jitosol", "@jito_sol"],
-            "drift": ["drift", "@driftprotocol"],
-            "tensor": ["tensor", "@tensor_hq"],
-            "helius": ["helius", "@heaboronin"],
-            "orca": ["orca", "@orca_so"],
-            "raydium": ["raydium"],
-            "metaplex": ["metaplex"],
-            "phantom": ["phantom", "@phantom"],
-            "compressed-nft": ["cnft", "compressed nft", "state compression"],
-            "token-extensions": ["token-2022", "token extensions"],
-            "blinks": ["blinks", "solana actions"],
-            "depin": ["depin"],
-            "solana-mobile": ["solana mobile", "saga"],
-            "ai-agents": ["ai agent", "solana ai", "ai x crypto", "deai"],
-            "mev": ["mev", "jito tips"],
-            "firedancer": ["firedancer", "frankendancer"],
-            "grpc": ["grpc", "geyser"],
-            "defi": ["defi"],
-            "nft": ["nft"],
-            "payments": ["solana pay", "payments"],
-            "gaming": ["gaming", "gamefi"],
-            "dao": ["dao", "governance"],
-            "svm": ["svm", "solana virtual machine", "eclipse", "neon"],
-            "validator": ["validator", "staking"],
-        }
-
-        for entity, keywords in entity_keywords.items():
-            for kw in keywords:
-                if kw in text_lower:
-                    entities.append(entity)
-                    break
-
-        return list(set(entities)) if entities else ["solana-ecosystem"]
+        # Matches are already unique and in table order
+        scan_text = text[:ENTITY_SCAN_CHARS].lower()
+        return _ENTITY_MATCHER.match(scan_text) or ["solana-ecosystem"]
 
     def fetch(self, window_start: datetime, window_end: datetime) -> list[SignalEvent]:
         """Fetch Twitter/X signals."""
         cache_key = f"twitter_{window_start.date()}_{window_end.date()}"
         cached = self._get_cached(cache_key)
         if cached:
-            return [SignalEvent.from_dict(e) for e in cached]
+            return cached
 
         events = []
         logger.info("fetching_twitter_data")
@@ -260,21 +358,74 @@ class TwitterConnector(BaseConnector):
             events = self._fetch_via_nitter(window_start)
             logger.info("twitter_nitter_fetch", event_count=len(events))
 
+        # Add tweets stored by earlier runs for overlapping windows
+        events = self._merge_stored_events(events, window_start, window_end)
+
         # Final fallback to snapshot
         if not events:
             logger.warning("twitter_fetch_empty", reason="Loading snapshot fallback")
             events = self._load_snapshot_fallback()
 
         if events:
-            self._set_cached(cache_key, [e.to_dict() for e in events])
+            self._set_cached(cache_key, events)
 
         logger.info("twitter_fetch_complete", event_count=len(events))
         return events
 
+    def _merge_stored_events(
+        self, events: list[SignalEvent], window_start: datetime, window_end: datetime
+    ) -> list[SignalEvent]:
+        """Store fetched tweets and add earlier ones in the window.
+
+        Nitter only serves each account's latest posts, so tweets seen by
+        an earlier run for an overlapping window would otherwise be lost.
+        Tweets are stored in one entry per day, so only the days the window
+        covers are read back.
+        """
+        if self._event_store is None:
+            return events
+        ttl_hours = self.config.get("cache", {}).get("ttl_hours", 336)
+        start = window_start.replace(tzinfo=None)
+        end = window_end.replace(tzinfo=None)
+
+        days: dict[date, dict] = {}
+
+        def stored_day(day: date) -> dict:
+            if day not in days:
+                days[day] = self._event_store.get(f"twitter:{day.isoformat()}") or {}
+            return days[day]
+
+        merged = {}
+        touched = set()
+        for event in events:
+            key = f"{event.author}:{event.url or event.content_hash}"
+            day = event.timestamp.replace(tzinfo=None).date()
+            stored_day(day)[key] = event
+            touched.add(day)
+            merged[key] = event
+        for day in touched:
+            self._event_store.set(f"twitter:{day.isoformat()}", days[day], expire=ttl_hours * 3600)
+
+        day = start.date()
+        while day <= end.date():
+            for key, event in stored_day(day).items():
+                if key not in merged and start <= event.timestamp.replace(tzinfo=None) < end:
+                    merged[key] = event
+            day += timedelta(days=1)
+        return list(merged.values())
+
+    def close(self):
+        super().close()
+        if self._nitter_state is not None:
+            self._nitter_state.close()
+        if self._feed_state is not None:
+            self._feed_state.close()
+        if self._event_store is not None:
+            self._event_store.close()
+
     def _load_snapshot_fallback(self) -> list[SignalEvent]:
         """Load bundled snapshot."""
         snapshot_path = Path("data/snapshots/twitter_snapshot.json")
         if snapshot_path.exists():
-            data = json.loads(snapshot_path.read_text())
-            return [SignalEvent.from_dict(e) for e in data]
+            return decode_events(snapshot_path.read_bytes())
         return []
@@ -8,13 +8,19 @@ from __future__ import annotations
 
 import re
 from collections import Counter, defaultdict
-from itertools import combinations
-from typing import Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Optional
 
 import numpy as np
-from sklearn.cluster import AgglomerativeClustering
+from scipy import sparse
+from sklearn.cluster import AgglomerativeClustering, MiniBatchKMeans
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    import simsimd
+except ImportError:  # pragma: no cover - sparse product fallback
+    simsimd = None
 
 from pipeline.models import SignalEvent, NarrativeCandidate
 from pipeline.logging import get_logger
@@ -30,6 +36,118 @@ NARRATIVE_STOP_WORDS = {
     "than", "its", "out", "over", "all", "are", "but", "not", "you",
     "was", "they", "their", "what", "which", "when", "would", "there",
 }
+# TfidfVectorizer takes a list; build it once, in a reproducible order
+NARRATIVE_STOP_WORDS_LIST = sorted(NARRATIVE_STOP_WORDS)
+
+# Display names for entities in narrative labels
+CATEGORY_LABELS = {
+    "defi": "DeFi",
+    "nft": "NFT",
+    "depin": "DePIN",
+    "ai-agents": "AI Agents",
+    "mev": "MEV",
+    "svm": "SVM Expansion",
+    "firedancer": "Firedancer",
+    "compressed-nft": "Compressed NFTs",
+    "token-extensions": "Token Extensions",
+    "blinks": "Blinks & Actions",
+    "solana-mobile": "Solana Mobile",
+    "gaming": "Gaming",
+    "dao": "DAOs & Governance",
+    "validator": "Validator Infrastructure",
+    "payments": "Payments",
+    "grpc": "Data Infrastructure",
+}
+
+# Above this many events, text clustering switches from average-linkage on a
+# dense n x n distance matrix to mini-batch k-means on the sparse TF-IDF rows
+TEXT_CLUSTER_DENSE_LIMIT = 2000
+
+_URL_RE = re.compile(r"https?://\S+")
+_MENTION_RE = re.compile(r"@\w+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s\-]")
+_WS_RE = re.compile(r"\s+")
+# ASCII table equivalent to _NON_ALNUM_RE.sub(" ", ...); derived from the
+# pattern so the two can't drift apart
+_NON_ALNUM_TABLE = {i: " " for i in range(128) if _NON_ALNUM_RE.match(chr(i))}
+
+
+@lru_cache(maxsize=4096)
+def _preprocess(text: str) -> str:
+    """Lowercase and strip URLs, mentions and punctuation.
+
+    Cached because candidate keyword extraction re-reads the same event
+    texts that text clustering already cleaned.
+    """
+    text = _URL_RE.sub("", text.lower())
+    text = _MENTION_RE.sub("", text)
+    if text.isascii():
+        text = text.translate(_NON_ALNUM_TABLE)
+    else:
+        text = _NON_ALNUM_RE.sub(" ", text)
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _cosine_distances(tfidf_matrix) -> np.ndarray:
+    """Dense pairwise cosine distances; TF-IDF weights are non-negative, so [0, 1]."""
+    if simsimd is not None:
+        # At most 500 columns, so the dense copy is small; SIMD kernels
+        # compute the distances directly
+        dense = tfidf_matrix.toarray().astype(np.float32)
+        distance_matrix = np.asarray(simsimd.cdist(dense, dense, metric="cosine"))
+        # simsimd reports 0 for a pair of all-zero rows; sklearn and the
+        # sparse path below treat an empty row as unrelated to everything
+        empty = tfidf_matrix.getnnz(axis=1) == 0
+        distance_matrix[empty, :] = 1
+        distance_matrix[:, empty] = 1
+    else:
+        # TfidfVectorizer rows are already L2-normalized, so the sparse
+        # Gram matrix is the cosine similarity; densify only the result
+        sim_matrix = (tfidf_matrix @ tfidf_matrix.T).toarray()
+        distance_matrix = 1 - np.clip(sim_matrix, 0, 1)
+    np.fill_diagonal(distance_matrix, 0)
+    return distance_matrix
+
+
+def _entity_mask(entities: Iterable[str], entity_bits: dict[str, int]) -> int:
+    """Bitmask of entities, allocating a bit for each name not seen yet."""
+    mask = 0
+    for entity in entities:
+        bit = entity_bits.get(entity)
+        if bit is None:
+            bit = entity_bits[entity] = 1 << len(entity_bits)
+        mask |= bit
+    return mask
+
+
+def _popcount(mask: int) -> int:
+    # int.bit_count() needs Python 3.10
+    return bin(mask).count("1")
+
+
+class _DisjointSet:
+    """Union-find over ids 0..size-1, with path halving and union by rank."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
 
 
 class NarrativeClusterer:
@@ -49,8 +167,19 @@ class NarrativeClusterer:
         # Step 1: Entity co-occurrence analysis
         entity_clusters = self._entity_cooccurrence_clusters(events)
 
-        # Step 2: Text-based clustering
-        text_clusters = self._text_clusters(events)
+        # Step 2: Text-based clustering, only worth its TF-IDF fit and O(n^2)
+        # linkage when entity clusters leave enough events uncovered. Only
+        # clusters big enough to survive _merge_clusters count as coverage.
+        clustered_entities = set().union(*(
+            cluster for cluster in entity_clusters
+            if sum(1 for e in events if not cluster.isdisjoint(e.entities)) >= self.min_cluster_size
+        ))
+        uncovered = sum(1 for e in events if clustered_entities.isdisjoint(e.entities))
+        if uncovered < max(self.min_cluster_size * 2, 0.15 * len(events)):
+            logger.info("text_clustering_skipped", uncovered=uncovered, total=len(events))
+            text_clusters = []
+        else:
+            text_clusters = self._text_clusters(events)
 
         # Step 3: Merge clusters
         candidates = self._merge_clusters(entity_clusters, text_clusters, events)
@@ -65,55 +194,62 @@ class NarrativeClusterer:
         self, events: list[SignalEvent]
     ) -> list[set[str]]:
         """Build entity co-occurrence graph and extract clusters."""
-        # Count co-occurrences
-        cooccurrence = Counter()
-        entity_counts = Counter()
-
-        for event in events:
-            entities = [e for e in event.entities if e != "solana-ecosystem"]
-            for entity in entities:
-                entity_counts[entity] += 1
-            for pair in combinations(sorted(set(entities)), 2):
-                cooccurrence[pair] += 1
-
-        # Build adjacency with min threshold
+        # Event x entity incidence matrix; entity ids follow first appearance
+        entity_ids: dict[str, int] = {}
+        rows, cols = [], []
+        for i, event in enumerate(events):
+            for entity in event.entities:
+                if entity != "solana-ecosystem":
+                    rows.append(i)
+                    cols.append(entity_ids.setdefault(entity, len(entity_ids)))
+        entities = list(entity_ids)
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(events), len(entities)),
+        )
+        incidence.data.fill(1)  # an entity listed twice in one event counts once
+
+        entity_counts = np.asarray(incidence.sum(axis=0)).ravel()
+
+        # An entity mentioned fewer than min_cooccurrence times can't be in a
+        # qualifying pair, so only the remaining columns enter the product
         min_cooccurrence = 2
-        adjacency = defaultdict(set)
-        for (a, b), count in cooccurrence.items():
-            if count >= min_cooccurrence:
-                adjacency[a].add(b)
-                adjacency[b].add(a)
-
-        # Connected components via BFS
-        visited = set()
-        clusters = []
-        for entity in adjacency:
-            if entity in visited:
-                continue
-            cluster = set()
-            queue = [entity]
-            while queue:
-                node = queue.pop(0)
-                if node in visited:
-                    continue
-                visited.add(node)
-                cluster.add(node)
-                for neighbor in adjacency[node]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-            if len(cluster) >= 1:
-                clusters.append(cluster)
+        paired = np.flatnonzero(entity_counts >= min_cooccurrence)
+        paired_incidence = incidence[:, paired]
+
+        # Off-diagonal entries of M.T @ M are pair co-occurrence counts
+        cooccurrence = (paired_incidence.T @ paired_incidence).tocoo()
+
+        # Union entities linked by frequent co-occurrence
+        qualifying = (cooccurrence.row < cooccurrence.col) & (
+            cooccurrence.data >= min_cooccurrence
+        )
+        dsu = _DisjointSet(len(entities))
+        linked = set()
+        for a, b in zip(
+            paired[cooccurrence.row[qualifying]].tolist(),
+            paired[cooccurrence.col[qualifying]].tolist(),
+        ):
+            dsu.union(a, b)
+            linked.add(a)
+            linked.add(b)
+
+        # Connected components, grouped by root in first-appearance order
+        components = defaultdict(set)
+        for idx in sorted(linked):
+            components[dsu.find(idx)].add(entities[idx])
+        clusters = list(components.values())
 
         # Add standalone entities with enough mentions
         min_standalone_mentions = 3
-        for entity, count in entity_counts.items():
-            if entity not in visited and count >= min_standalone_mentions:
-                clusters.append({entity})
+        for idx, count in enumerate(entity_counts.tolist()):
+            if idx not in linked and count >= min_standalone_mentions:
+                clusters.append({entities[idx]})
 
         logger.info(
             "entity_clusters",
             cluster_count=len(clusters),
-            total_entities=len(entity_counts),
+            total_entities=len(entities),
         )
         return clusters
 
@@ -127,10 +263,11 @@ class NarrativeClusterer:
         # TF-IDF vectorization
         vectorizer = TfidfVectorizer(
             max_features=500,
-            stop_words=list(NARRATIVE_STOP_WORDS),
+            stop_words=NARRATIVE_STOP_WORDS_LIST,
             min_df=2,
             max_df=0.8,
             ngram_range=(1, 2),
+            norm="l2",
         )
 
         try:
@@ -139,20 +276,26 @@ class NarrativeClusterer:
             # Not enough terms after filtering
             return [list(range(len(texts)))]
 
-        # Compute similarity matrix
-        sim_matrix = cosine_similarity(tfidf_matrix)
-        distance_matrix = 1 - np.clip(sim_matrix, 0, 1)
-        np.fill_diagonal(distance_matrix, 0)
-
-        # Agglomerative clustering
         n_clusters = min(self.max_clusters, max(2, len(events) // 5))
         try:
-            clustering = AgglomerativeClustering(
-                n_clusters=n_clusters,
-                metric="precomputed",
-                linkage="average",
-            )
-            labels = clustering.fit_predict(distance_matrix)
+            if len(events) > TEXT_CLUSTER_DENSE_LIMIT:
+                # An n x n distance matrix gets expensive past this size;
+                # k-means on the L2-normalized sparse rows approximates
+                # cosine clustering in O(n * k) per iteration
+                clustering = MiniBatchKMeans(
+                    n_clusters=n_clusters,
+                    batch_size=256,
+                    n_init=3,
+                    random_state=0,
+                )
+                labels = clustering.fit_predict(tfidf_matrix)
+            else:
+                clustering = AgglomerativeClustering(
+                    n_clusters=n_clusters,
+                    metric="precomputed",
+                    linkage="average",
+                )
+                labels = clustering.fit_predict(_cosine_distances(tfidf_matrix))
         except Exception as e:
             logger.warning("clustering_failed", error=str(e))
             return [list(range(len(events)))]
@@ -168,12 +311,7 @@ class NarrativeClusterer:
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for clustering."""
-        text = text.lower()
-        text = re.sub(r"https?://\S+", "", text)
-        text = re.sub(r"@\w+", "", text)
-        text = re.sub(r"[^a-z0-9\s\-]", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return _preprocess(text)
 
     def _merge_clusters(
         self,
@@ -182,14 +320,20 @@ class NarrativeClusterer:
         events: list[SignalEvent],
     ) -> list[NarrativeCandidate]:
         """Merge entity-based and text-based clusters into narrative candidates."""
+        # Entity sets as int bitmasks, so every overlap test is one AND
+        entity_bits: dict[str, int] = {}
+        event_masks = [_entity_mask(event.entities, entity_bits) for event in events]
+
         candidates = []
+        candidate_masks = []
         used_event_indices = set()
 
         # Priority 1: Entity-based clusters (stronger signal)
         for i, entity_set in enumerate(entity_clusters):
+            cluster_mask = _entity_mask(entity_set, entity_bits)
             matching_events = []
             for idx, event in enumerate(events):
-                if entity_set.intersection(set(event.entities)):
+                if event_masks[idx] & cluster_mask:
                     matching_events.append(event)
                     used_event_indices.add(idx)
 
@@ -202,6 +346,7 @@ class NarrativeClusterer:
                     entities=sorted(entity_set),
                 )
                 candidates.append(candidate)
+                candidate_masks.append(cluster_mask)
 
         # Priority 2: Text clusters for uncovered events
         for i, indices in enumerate(text_cluster_indices):
@@ -209,18 +354,21 @@ class NarrativeClusterer:
             if len(remaining_indices) >= self.min_cluster_size:
                 cluster_events = [events[idx] for idx in remaining_indices]
                 all_entities = set()
-                for event in cluster_events:
-                    all_entities.update(event.entities)
+                all_mask = 0
+                for idx in remaining_indices:
+                    all_entities.update(events[idx].entities)
+                    all_mask |= event_masks[idx]
+                entity_count = _popcount(all_mask)
 
                 # Check if this overlaps significantly with an existing candidate
                 merged = False
-                for candidate in candidates:
-                    overlap = all_entities.intersection(set(candidate.entities))
-                    if len(overlap) >= len(all_entities) * 0.5:
+                for j, candidate in enumerate(candidates):
+                    if _popcount(all_mask & candidate_masks[j]) >= entity_count * 0.5:
                         candidate.events.extend(cluster_events)
                         candidate.entities = sorted(
-                            set(candidate.entities) | all_entities
+                            all_entities.union(candidate.entities)
                         )
+                        candidate_masks[j] |= all_mask
                         merged = True
                         break
 
@@ -233,6 +381,7 @@ class NarrativeClusterer:
                         entities=sorted(all_entities - {"solana-ecosystem"}),
                     )
                     candidates.append(candidate)
+                    candidate_masks.append(_entity_mask(candidate.entities, entity_bits))
 
         # Sort by event count
         candidates.sort(key=lambda c: len(c.events), reverse=True)
@@ -278,29 +427,8 @@ class NarrativeClusterer:
     def _generate_label(self, entities: list[str], keywords: list[str]) -> str:
         """Generate a human-readable narrative label."""
         label_parts = []
-
-        # Category mapping for better labels
-        category_labels = {
-            "defi": "DeFi",
-            "nft": "NFT",
-            "depin": "DePIN",
-            "ai-agents": "AI Agents",
-            "mev": "MEV",
-            "svm": "SVM Expansion",
-            "firedancer": "Firedancer",
-            "compressed-nft": "Compressed NFTs",
-            "token-extensions": "Token Extensions",
-            "blinks": "Blinks & Actions",
-            "solana-mobile": "Solana Mobile",
-            "gaming": "Gaming",
-            "dao": "DAOs & Governance",
-            "validator": "Validator Infrastructure",
-            "payments": "Payments",
-            "grpc": "Data Infrastructure",
-        }
-
         for entity in entities[:2]:
-            label_parts.append(category_labels.get(entity, entity.replace("-", " ").title()))
+            label_parts.append(CATEGORY_LABELS.get(entity, entity.replace("-", " ").title()))
 
         if not label_parts:
             label_parts = [kw.title() for kw in keywords[:2]]
@@ -309,11 +437,11 @@ class NarrativeClusterer:
 
     def _generate_description(self, candidate: NarrativeCandidate) -> str:
         """Generate narrative description from events."""
-        source_types = Counter(e.source_subtype.value for e in candidate.events)
-        entity_mentions = Counter()
-        for e in candidate.events:
-            for ent in e.entities:
-                entity_mentions[ent] += 1
+        subtypes = Counter([e.source_subtype for e in candidate.events])
+        source_types = Counter({subtype.value: n for subtype, n in subtypes.items()})
+        # Counting a whole iterable runs in C; per-item += goes through
+        # Counter.__missing__ for every new key
+        entity_mentions = Counter(chain.from_iterable(e.entities for e in candidate.events))
 
         top_entities = [e for e, _ in entity_mentions.most_common(5)]
         source_summary = ", ".join(f"{st}({c})" for st, c in source_types.most_common())
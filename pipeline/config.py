@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -15,11 +17,22 @@ load_dotenv()
 _DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "default.yaml"
 
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=4)
+def _parse_config(config_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a config file once per on-disk version (keyed by mtime)."""
+    with open(config_path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_config(path: str | Path | None = None) -> dict[str, Any]:
     """Load configuration from YAML file, with env var overrides."""
-    config_path = Path(path) if path else _DEFAULT_CONFIG_PATH
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config_path = Path(path).resolve() if path else _DEFAULT_CONFIG_PATH
+    # Callers mutate their config, so each gets its own copy of the parse
+    config = copy.deepcopy(_parse_config(config_path, config_path.stat().st_mtime_ns))
 
     # Override with environment variables
     if os.getenv("SOLANA_RPC_URL"):
@@ -6,9 +6,11 @@ and confidence assessments for each narrative.
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import NamedTuple, Optional
 
 from pipeline.models import (
     NarrativeCandidate,
@@ -21,6 +23,42 @@ from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Evidence card prefix per source subtype
+SOURCE_LABELS = {
+    "github": "GitHub",
+    "twitter": "X/Twitter",
+    "rss_blog": "Blog",
+    "program_deploy": "Onchain",
+    "tx_activity": "Onchain Metrics",
+    "token_activity": "Token Data",
+}
+
+
+class _EventsSummary(NamedTuple):
+    """Per-candidate event tallies shared by the explanation builders."""
+
+    subtype_counts: Counter
+    onchain: int
+    offchain: int
+    authors: set
+    latest: Optional[SignalEvent]
+
+
+def _summarize_events(events: list[SignalEvent]) -> _EventsSummary:
+    """Tally source types, authors and the latest event for a candidate."""
+    # Count enum members and read .value once per distinct subtype; the
+    # enum value lookup is a Python-level descriptor call
+    subtypes = Counter([e.source_subtype for e in events])
+    subtype_counts = Counter({subtype.value: n for subtype, n in subtypes.items()})
+    types = [e.source_type for e in events]
+    return _EventsSummary(
+        subtype_counts=subtype_counts,
+        onchain=types.count(SourceType.ONCHAIN),
+        offchain=types.count(SourceType.OFFCHAIN),
+        authors={e.author for e in events if e.author},
+        latest=max(events, key=attrgetter("timestamp"), default=None),
+    )
+
 
 class NarrativeExplainer:
     """Builds human-readable explanations for detected narratives."""
@@ -29,15 +67,36 @@ class NarrativeExplainer:
         self.config = config
         self.max_evidence_cards = 8
 
+    def explain_all(
+        self,
+        candidate: NarrativeCandidate,
+        score: ScoreBreakdown,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> tuple[str, str, list[EvidenceCard], float, str]:
+        """Build explanation, why-now, evidence cards and confidence together.
+
+        The candidate's events are tallied once and shared by every builder.
+        Returns (explanation, why_now, evidence_cards, confidence, reasoning).
+        """
+        summary = _summarize_events(candidate.events)
+        explanation = self.build_explanation(candidate, score, summary)
+        why_now = self.build_why_now(candidate, score, window_start, window_end, summary)
+        evidence_cards = self.build_evidence_cards(candidate, score)
+        confidence, reasoning = self.compute_confidence(candidate, score, summary)
+        return explanation, why_now, evidence_cards, confidence, reasoning
+
     def build_explanation(
         self,
         candidate: NarrativeCandidate,
         score: ScoreBreakdown,
+        summary: Optional[_EventsSummary] = None,
     ) -> str:
         """Generate a concise explanation of what the narrative is and why it matters."""
+        summary = summary or _summarize_events(candidate.events)
         entities = candidate.entities[:5]
         event_count = len(candidate.events)
-        source_types = Counter(e.source_subtype.value for e in candidate.events)
+        source_types = summary.subtype_counts
 
         entity_str = ", ".join(e.replace("-", " ").title() for e in entities)
         source_str = ", ".join(
@@ -76,8 +135,10 @@ class NarrativeExplainer:
         score: ScoreBreakdown,
         window_start: datetime,
         window_end: datetime,
+        summary: Optional[_EventsSummary] = None,
     ) -> str:
         """Generate a 'why now' section explaining acceleration."""
+        summary = summary or _summarize_events(candidate.events)
         parts = []
 
         # Velocity-driven
@@ -88,8 +149,7 @@ class NarrativeExplainer:
             )
 
         # Cross-domain signal
-        onchain = sum(1 for e in candidate.events if e.source_type == SourceType.ONCHAIN)
-        offchain = sum(1 for e in candidate.events if e.source_type == SourceType.OFFCHAIN)
+        onchain, offchain = summary.onchain, summary.offchain
         if onchain > 0 and offchain > 0:
             parts.append(
                 f"Cross-domain corroboration: {onchain} onchain signals and "
@@ -97,9 +157,8 @@ class NarrativeExplainer:
             )
 
         # Specific triggers
-        recent_events = sorted(candidate.events, key=lambda e: e.timestamp, reverse=True)
-        if recent_events:
-            latest = recent_events[0]
+        latest = summary.latest
+        if latest is not None:
             parts.append(
                 f"Most recent trigger: {latest.text[:150]}..."
                 + (f" ({latest.url})" if latest.url else "")
@@ -113,7 +172,7 @@ class NarrativeExplainer:
             )
 
         # Unique contributors
-        unique_authors = set(e.author for e in candidate.events if e.author)
+        unique_authors = summary.authors
         if len(unique_authors) > 3:
             parts.append(
                 f"{len(unique_authors)} distinct contributors are driving this signal, "
@@ -133,40 +192,36 @@ class NarrativeExplainer:
         score: ScoreBreakdown,
     ) -> list[EvidenceCard]:
         """Build ranked evidence cards for the narrative."""
-        cards = []
-
-        for event in candidate.events:
-            relevance = self._score_event_relevance(event, candidate, score)
-            summary = self._summarize_event(event)
-            metric_highlight = self._highlight_metric(event)
-
-            cards.append(
-                EvidenceCard(
-                    event=event,
-                    relevance_score=relevance,
-                    summary=summary,
-                    metric_highlight=metric_highlight,
-                )
+        candidate_entities = frozenset(candidate.entities)
+        scored = [
+            (self._score_event_relevance(event, candidate_entities), event)
+            for event in candidate.events
+        ]
+
+        # Only the top N become cards, so summarize just those; nlargest keeps
+        # the same tie order as a stable descending sort
+        top = heapq.nlargest(self.max_evidence_cards, scored, key=lambda pair: pair[0])
+        return [
+            EvidenceCard(
+                event=event,
+                relevance_score=relevance,
+                summary=self._summarize_event(event),
+                metric_highlight=self._highlight_metric(event),
             )
-
-        # Sort by relevance and take top N
-        cards.sort(key=lambda c: c.relevance_score, reverse=True)
-        return cards[: self.max_evidence_cards]
+            for relevance, event in top
+        ]
 
     def _score_event_relevance(
         self,
         event: SignalEvent,
-        candidate: NarrativeCandidate,
-        score: ScoreBreakdown,
+        candidate_entities: frozenset[str],
     ) -> float:
         """Score how relevant an event is to the narrative."""
         relevance = 0.5
 
         # Entity overlap
-        event_entities = set(event.entities)
-        candidate_entities = set(candidate.entities)
         if candidate_entities:
-            overlap = len(event_entities & candidate_entities) / len(candidate_entities)
+            overlap = len(candidate_entities.intersection(event.entities)) / len(candidate_entities)
             relevance += overlap * 0.2
 
         # Source diversity bonus
@@ -188,14 +243,8 @@ class NarrativeExplainer:
 
     def _summarize_event(self, event: SignalEvent) -> str:
         """Create a concise summary of an event."""
-        source_label = {
-            "github": "GitHub",
-            "twitter": "X/Twitter",
-            "rss_blog": "Blog",
-            "program_deploy": "Onchain",
-            "tx_activity": "Onchain Metrics",
-            "token_activity": "Token Data",
-        }.get(event.source_subtype.value, event.source_subtype.value)
+        subtype = event.source_subtype.value
+        source_label = SOURCE_LABELS.get(subtype, subtype)
 
         text = event.text[:200]
         if len(event.text) > 200:
@@ -235,8 +284,10 @@ class NarrativeExplainer:
         self,
         candidate: NarrativeCandidate,
         score: ScoreBreakdown,
+        summary: Optional[_EventsSummary] = None,
     ) -> tuple[float, str]:
         """Compute confidence level with reasoning."""
+        summary = summary or _summarize_events(candidate.events)
         factors = []
         confidence = 0.5  # base
 
@@ -264,7 +315,7 @@ class NarrativeExplainer:
             factors.append("Single-domain only (lower confidence)")
 
         # Source diversity
-        source_types = set(e.source_subtype.value for e in candidate.events)
+        source_types = summary.subtype_counts
         if len(source_types) >= 3:
             confidence += 0.1
             factors.append(f"Diverse sources ({len(source_types)} types)")
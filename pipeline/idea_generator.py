@@ -7,7 +7,10 @@ Each idea ties back to specific evidence and includes MVP scope.
 from __future__ import annotations
 
 from collections import Counter
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Iterator, Mapping, NamedTuple, Optional
 
 from pipeline.models import (
     NarrativeCandidate,
@@ -19,8 +22,9 @@ from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Template library of build idea patterns organized by narrative theme
-IDEA_TEMPLATES = {
+# Template library of build idea patterns organized by narrative theme; frozen
+# into IDEA_TEMPLATES below
+_RAW_IDEA_TEMPLATES = {
     "defi": [
         {
             "title": "Real-Time DeFi Risk Dashboard",
@@ -271,8 +275,9 @@ IDEA_TEMPLATES = {
     ],
 }
 
-# Default generic templates for narratives not in the library
-DEFAULT_TEMPLATES = [
+# Default generic templates for narratives not in the library; frozen into
+# DEFAULT_TEMPLATES below
+_RAW_DEFAULT_TEMPLATES = [
     {
         "title": "Real-Time {entity} Monitor",
         "problem": "Lack of real-time visibility into {entity} activity and metrics on Solana.",
@@ -302,6 +307,82 @@ DEFAULT_TEMPLATES = [
     },
 ]
 
+DEFAULT_VALIDATION = "Run a 2-week pilot with early adopters."
+
+# At least one idea per narrative should come from these categories
+NON_CONSUMER_CATEGORIES = frozenset({"infrastructure", "developer_tooling", "analytics"})
+
+
+class IdeaTemplate(NamedTuple):
+    """One build-idea template row; default templates hold {entity} placeholders."""
+
+    title: str
+    problem: str
+    target: str
+    why_solana: str
+    mvp: str
+    risks: str
+    category: str
+    validation: str
+
+
+def _freeze_templates(templates: list[dict]) -> tuple[IdeaTemplate, ...]:
+    """Immutable template rows with the validation step split out of "risks" once."""
+    frozen = []
+    for template in templates:
+        risks = template["risks"]
+        validation = risks.split("Validate ")[-1] if "Validate" in risks else DEFAULT_VALIDATION
+        frozen.append(IdeaTemplate(**template, validation=validation))
+    return tuple(frozen)
+
+
+IDEA_TEMPLATES = MappingProxyType(
+    {theme: _freeze_templates(templates) for theme, templates in _RAW_IDEA_TEMPLATES.items()}
+)
+DEFAULT_TEMPLATES = _freeze_templates(_RAW_DEFAULT_TEMPLATES)
+
+
+def _idea_fields(template: IdeaTemplate) -> MappingProxyType:
+    """BuildIdea keyword arguments for a library template, minus evidence links."""
+    return MappingProxyType({
+        "title": template.title,
+        "problem_statement": template.problem,
+        "target_user": template.target,
+        "why_solana": template.why_solana,
+        "mvp_scope": template.mvp,
+        "risks_unknowns": template.risks,
+        "validation_approach": template.validation,
+        "category": template.category,
+    })
+
+
+# Entity-specific ideas differ only in their evidence links, so their
+# constructor arguments are mapped out of the templates once
+_IDEA_FIELDS = MappingProxyType({
+    theme: tuple(_idea_fields(template) for template in templates)
+    for theme, templates in IDEA_TEMPLATES.items()
+})
+
+# Plain set for the per-entity membership test; the mapping proxy adds an
+# indirection to every lookup
+_KNOWN_THEMES = frozenset(_IDEA_FIELDS)
+
+
+@lru_cache(maxsize=512)
+def _render_default(primary_entity: str, idx: int) -> MappingProxyType:
+    """BuildIdea keyword arguments of a default template rendered for an entity."""
+    template = DEFAULT_TEMPLATES[idx]
+    return MappingProxyType({
+        "title": template.title.format(entity=primary_entity.replace("-", " ").title()),
+        "problem_statement": template.problem.format(entity=primary_entity),
+        "target_user": template.target.format(entity=primary_entity),
+        "why_solana": template.why_solana.format(entity=primary_entity),
+        "mvp_scope": template.mvp.format(entity=primary_entity),
+        "risks_unknowns": template.risks.format(entity=primary_entity),
+        "validation_approach": "Run a 2-week pilot with early adopters and gather structured feedback.",
+        "category": template.category,
+    })
+
 
 class IdeaGenerator:
     """Generates build ideas for detected narratives."""
@@ -319,73 +400,54 @@ class IdeaGenerator:
         evidence_cards: list[EvidenceCard],
     ) -> list[BuildIdea]:
         """Generate build ideas for a narrative."""
+        evidence_urls = list(islice(
+            (ec.event.url for ec in evidence_cards if ec.event.url), 5
+        ))
+
+        # Deduplicate by title and stop once enough ideas are in; later
+        # candidates could never make the cut, so they aren't built
         ideas = []
-        entities = candidate.entities
-        evidence_urls = [
-            ec.event.url for ec in evidence_cards if ec.event.url
-        ][:5]
+        seen_titles = set()
+        for fields in self._candidate_fields(candidate.entities):
+            if len(ideas) >= self.ideas_per_narrative:
+                break
+            if fields["title"] not in seen_titles:
+                seen_titles.add(fields["title"])
+                ideas.append(BuildIdea(**fields, evidence_links=evidence_urls))
+        return ideas
+
+    def _candidate_fields(self, entities: list[str]) -> Iterator[Mapping[str, str]]:
+        """BuildIdea arguments in priority order, duplicates included."""
+        matched = 0
+        has_non_consumer = False
 
         # 1. Try entity-specific templates
-        for entity in entities:
-            if entity in IDEA_TEMPLATES:
-                for template in IDEA_TEMPLATES[entity]:
-                    idea = BuildIdea(
-                        title=template["title"],
-                        problem_statement=template["problem"],
-                        target_user=template["target"],
-                        why_solana=template["why_solana"],
-                        mvp_scope=template["mvp"],
-                        risks_unknowns=template["risks"],
-                        validation_approach=template["risks"].split("Validate ")[-1] if "Validate" in template["risks"] else "Run a 2-week pilot with early adopters.",
-                        category=template["category"],
-                        evidence_links=evidence_urls,
-                    )
-                    ideas.append(idea)
+        for entity in (e for e in entities if e in _KNOWN_THEMES):
+            for fields in _IDEA_FIELDS[entity]:
+                matched += 1
+                has_non_consumer = has_non_consumer or fields["category"] in NON_CONSUMER_CATEGORIES
+                yield fields
 
         # 2. Fill with default templates if needed
-        if len(ideas) < self.ideas_per_narrative:
-            primary_entity = entities[0] if entities else "this narrative"
-            for template in DEFAULT_TEMPLATES:
-                if len(ideas) >= self.ideas_per_narrative:
-                    break
-                idea = BuildIdea(
-                    title=template["title"].format(entity=primary_entity.replace("-", " ").title()),
-                    problem_statement=template["problem"].format(entity=primary_entity),
-                    target_user=template["target"].format(entity=primary_entity),
-                    why_solana=template["why_solana"].format(entity=primary_entity),
-                    mvp_scope=template["mvp"].format(entity=primary_entity),
-                    risks_unknowns=template["risks"].format(entity=primary_entity),
-                    validation_approach="Run a 2-week pilot with early adopters and gather structured feedback.",
-                    category=template["category"],
-                    evidence_links=evidence_urls,
-                )
-                ideas.append(idea)
+        primary_entity = entities[0] if entities else "this narrative"
+        for idx in range(len(DEFAULT_TEMPLATES)):
+            if matched >= self.ideas_per_narrative:
+                break
+            fields = _render_default(primary_entity, idx)
+            matched += 1
+            has_non_consumer = has_non_consumer or fields["category"] in NON_CONSUMER_CATEGORIES
+            yield fields
 
         # 3. Ensure at least one non-consumer idea
-        categories = set(i.category for i in ideas)
-        non_consumer = {"infrastructure", "developer_tooling", "analytics"}
-        if not categories.intersection(non_consumer) and ideas:
+        if not has_non_consumer and matched:
             primary_entity = entities[0] if entities else "ecosystem"
-            ideas.append(
-                BuildIdea(
-                    title=f"{primary_entity.replace('-', ' ').title()} DevTool Kit",
-                    problem_statement=f"Developers building on {primary_entity} lack integrated tooling for testing, debugging, and monitoring.",
-                    target_user=f"Solana developers working with {primary_entity}",
-                    why_solana="Solana-native tooling provides deeper integration and better DX than chain-agnostic alternatives.",
-                    mvp_scope="CLI tool with program testing, account inspection, and transaction simulation for the specific domain.",
-                    risks_unknowns="Competing with general tools; narrow target audience. Validate by surveying 20 developers.",
-                    validation_approach="Survey 20 active Solana developers and build features for top 3 pain points.",
-                    category="developer_tooling",
-                    evidence_links=evidence_urls,
-                )
-            )
-
-        # Deduplicate by title
-        seen_titles = set()
-        unique_ideas = []
-        for idea in ideas:
-            if idea.title not in seen_titles:
-                seen_titles.add(idea.title)
-                unique_ideas.append(idea)
-
-        return unique_ideas[: self.ideas_per_narrative]
+            yield {
+                "title": f"{primary_entity.replace('-', ' ').title()} DevTool Kit",
+                "problem_statement": f"Developers building on {primary_entity} lack integrated tooling for testing, debugging, and monitoring.",
+                "target_user": f"Solana developers working with {primary_entity}",
+                "why_solana": "Solana-native tooling provides deeper integration and better DX than chain-agnostic alternatives.",
+                "mvp_scope": "CLI tool with program testing, account inspection, and transaction simulation for the specific domain.",
+                "risks_unknowns": "Competing with general tools; narrow target audience. Validate by surveying 20 developers.",
+                "validation_approach": "Survey 20 active Solana developers and build features for top 3 pain points.",
+                "category": "developer_tooling",
+            }
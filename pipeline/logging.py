@@ -1,6 +1,7 @@
 """Structured logging setup."""
 
 import logging
+from functools import lru_cache
 
 import structlog
 
@@ -15,18 +16,21 @@ _LEVEL_MAP = {
 }
 
 
+# Processors are stateless, so both chains are built once and shared
+_BASE_PROCESSORS = (
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.TimeStamper(fmt="iso"),
+)
+_CONSOLE_PROCESSORS = _BASE_PROCESSORS + (structlog.dev.ConsoleRenderer(),)
+_JSON_PROCESSORS = _BASE_PROCESSORS + (structlog.processors.JSONRenderer(),)
+
+
 def setup_logging(level: str = "INFO"):
     """Configure structured logging."""
     numeric_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
     structlog.configure(
-        processors=[
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer()
-            if level == "DEBUG"
-            else structlog.processors.JSONRenderer(),
-        ],
+        processors=_CONSOLE_PROCESSORS if level == "DEBUG" else _JSON_PROCESSORS,
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
@@ -34,6 +38,9 @@ def setup_logging(level: str = "INFO"):
     )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str):
     """Get a named structured logger."""
+    # The lazy proxy reads the current configuration on use, so one per
+    # name stays valid across setup_logging calls
     return structlog.get_logger(name)
@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+import msgspec
+
 
 class SourceType(str, Enum):
     ONCHAIN = "onchain"
@@ -27,9 +29,12 @@ class SourceSubtype(str, Enum):
     FORUM = "forum"
 
 
-@dataclass
-class SignalEvent:
-    """A normalized event from any data source."""
+class SignalEvent(msgspec.Struct):
+    """A normalized event from any data source.
+
+    A msgspec Struct rather than a dataclass: instances are slotted, and
+    lists of events encode/decode to JSON in a single C pass.
+    """
 
     timestamp: datetime
     source_type: SourceType
@@ -37,7 +42,7 @@ class SignalEvent:
     entities: list[str]  # canonical entity names
     text: str  # description or snippet
     url: Optional[str] = None
-    metrics: dict = field(default_factory=dict)  # quantitative data
+    metrics: dict = msgspec.field(default_factory=dict)  # quantitative data
     raw_source: str = ""  # original source identifier
     author: str = ""
     author_followers: int = 0
@@ -49,13 +54,11 @@ class SignalEvent:
 
     def _compute_hash(self) -> str:
         content = f"{self.source_subtype}:{self.text[:200]}:{','.join(sorted(self.entities))}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
     def to_dict(self) -> dict:
-        d = asdict(self)
+        d = msgspec.to_builtins(self, enc_hook=str)
         d["timestamp"] = self.timestamp.isoformat()
-        d["source_type"] = self.source_type.value
-        d["source_subtype"] = self.source_subtype.value
         return d
 
     @classmethod
@@ -67,6 +70,16 @@ class SignalEvent:
         return cls(**d)
 
 
+_EVENTS_DECODER = msgspec.json.Decoder(list[SignalEvent])
+# str() anything in metrics that has no JSON form, as json.dumps(default=str) did
+EVENTS_ENCODER = msgspec.json.Encoder(enc_hook=str)
+
+
+def decode_events(raw: bytes) -> list[SignalEvent]:
+    """Decode a JSON array of serialized events straight into SignalEvents."""
+    return _EVENTS_DECODER.decode(raw)
+
+
 @dataclass
 class NarrativeCandidate:
     """A candidate narrative detected from clustering."""
@@ -5,16 +5,46 @@ Stage B+C of the pipeline: normalize entities, deduplicate near-identical events
 
 from __future__ import annotations
 
+import sys
 from collections import Counter
-from difflib import SequenceMatcher
 from typing import Optional
 
+import numpy as np
+from rapidfuzz import fuzz, process
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # pragma: no cover - all-pairs comparison below
+    MinHash = MinHashLSH = None
+
 from pipeline.models import SignalEvent
 from pipeline.config import get_entity_aliases
 from pipeline.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fuzzy dedup compares every event with everything kept before it, and every
+# path decides with the same fuzz.ratio threshold. From this group size on,
+# MinHash LSH narrows the comparison down to likely matches, and the dense
+# rapidfuzz similarity matrix is no longer built. That trades a little recall
+# for speed: a pair the ratio would flag is only compared if LSH proposes it.
+# Texts at the similarity threshold share far fewer shingles than their ratio
+# suggests, so the Jaccard threshold sits well below it to keep misses rare.
+LSH_MIN_GROUP = 200
+LSH_THRESHOLD = 0.5
+LSH_NUM_PERM = 128
+SHINGLE_SIZE = 3
+
+
+def _minhash(text: str) -> MinHash:
+    """MinHash signature over character shingles of an already-lowercased text."""
+    shingles = {
+        text[i:i + SHINGLE_SIZE].encode() for i in range(max(1, len(text) - SHINGLE_SIZE + 1))
+    }
+    signature = MinHash(num_perm=LSH_NUM_PERM)
+    signature.update_batch(list(shingles))
+    return signature
+
 
 class EventNormalizer:
     """Normalizes and deduplicates signal events."""
@@ -40,12 +70,13 @@ class EventNormalizer:
     def normalize_entity(self, entity: str) -> str:
         """Resolve entity to canonical name."""
         normalized = entity.lower().strip()
-        return self.alias_map.get(normalized, normalized)
+        # Interned, so later set/dict lookups across events match on identity
+        return sys.intern(self.alias_map.get(normalized, normalized))
 
     def normalize_events(self, events: list[SignalEvent]) -> list[SignalEvent]:
         """Normalize all entity references across events."""
         for event in events:
-            event.entities = list(set(
+            event.entities = list(dict.fromkeys(
                 self.normalize_entity(e) for e in event.entities
             ))
         logger.info("events_normalized", count=len(events))
@@ -75,17 +106,15 @@ class EventNormalizer:
         deduped = []
         removed_fuzzy = 0
         for subtype, group in by_subtype.items():
-            kept = []
-            for event in group:
-                is_dup = False
-                for existing in kept:
-                    sim = self._text_similarity(event.text[:200], existing.text[:200])
-                    if sim >= self.similarity_threshold:
-                        is_dup = True
-                        removed_fuzzy += 1
-                        break
-                if not is_dup:
-                    kept.append(event)
+            if len(group) < LSH_MIN_GROUP:
+                kept = self._dedup_group_matrix(group)
+            elif MinHashLSH is not None:
+                kept = self._dedup_group_lsh(group)
+            else:
+                # Large groups without LSH take the incremental scan: the
+                # dense cdist matrix would grow with the square of the group
+                kept = self._dedup_group(group)
+            removed_fuzzy += len(group) - len(kept)
             deduped.extend(kept)
 
         # Sort by timestamp
@@ -101,9 +130,74 @@ class EventNormalizer:
         )
         return deduped
 
+    def _dedup_group(self, group: list[SignalEvent]) -> list[SignalEvent]:
+        """Keep each event unless it is near-identical to one already kept.
+
+        Each text is scored against the kept texts in one rapidfuzz call, so
+        memory stays linear in the group size.
+        """
+        cutoff = self.similarity_threshold * 100
+        kept = []
+        kept_texts = []
+        for event in group:
+            text = event.text[:200].lower()
+            if process.extractOne(text, kept_texts, scorer=fuzz.ratio, score_cutoff=cutoff) is None:
+                kept.append(event)
+                kept_texts.append(text)
+        return kept
+
+    def _dedup_group_matrix(self, group: list[SignalEvent]) -> list[SignalEvent]:
+        """_dedup_group with every pair scored in one threaded rapidfuzz cdist call.
+
+        Walking the matrix in order, a kept event marks every later event it
+        matches as a duplicate, which keeps exactly what _dedup_group keeps.
+        """
+        texts = [event.text[:200].lower() for event in group]
+        cutoff = self.similarity_threshold * 100
+        similar = process.cdist(
+            texts, texts, scorer=fuzz.ratio, dtype=np.float32, workers=-1, score_cutoff=cutoff
+        ) >= cutoff
+        duplicate = np.zeros(len(group), dtype=bool)
+        kept = []
+        for i, event in enumerate(group):
+            if duplicate[i]:
+                continue
+            kept.append(event)
+            duplicate[i + 1:] |= similar[i, i + 1:]
+        return kept
+
+    def _dedup_group_lsh(self, group: list[SignalEvent]) -> list[SignalEvent]:
+        """_dedup_group for large groups: MinHash LSH proposes which kept events
+        to compare against, the similarity ratio confirms, so each event costs
+        a bucket probe instead of a scan over everything kept so far. A pair
+        LSH never proposes is kept even if its ratio clears the threshold."""
+        lsh = MinHashLSH(threshold=LSH_THRESHOLD, num_perm=LSH_NUM_PERM)
+        kept = []
+        kept_texts = []
+        for event in group:
+            text = event.text[:200].lower()
+            signature = _minhash(text)
+            if not any(
+                self._text_similarity(text, kept_texts[idx]) >= self.similarity_threshold
+                for idx in lsh.query(signature)
+            ):
+                lsh.insert(len(kept), signature)
+                kept.append(event)
+                kept_texts.append(text)
+        return kept
+
     def _text_similarity(self, a: str, b: str) -> float:
-        """Compute text similarity ratio."""
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        """Similarity ratio of two already-lowercased texts.
+
+        Scores that cannot reach the similarity threshold may come back as 0.0.
+        """
+        if a == b:
+            return 1.0
+        # At most min(len) characters can match, which caps the ratio
+        shorter = min(len(a), len(b))
+        if 2 * shorter < self.similarity_threshold * (len(a) + len(b)):
+            return 0.0
+        return fuzz.ratio(a, b, score_cutoff=self.similarity_threshold * 100) / 100.0
 
     def process(self, events: list[SignalEvent]) -> list[SignalEvent]:
         """Full normalization pipeline: normalize + dedup."""
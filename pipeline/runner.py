@@ -5,6 +5,7 @@ Runs the full narrative detection pipeline from ingestion to report generation.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -81,17 +82,21 @@ def run_pipeline(
         ("twitter", TwitterConnector(config, cache_enabled=True)),
     ]
 
-    for name, connector in connectors:
-        try:
-            events = connector.fetch(window_start, window_end)
-            all_events.extend(events)
+    results = asyncio.run(_fetch_all(connectors, window_start, window_end))
+    for (name, _), result in zip(connectors, results):
+        # gather() also hands back BaseExceptions such as CancelledError
+        if isinstance(result, BaseException):
+            errors.append(f"{name}: {type(result).__name__}: {result}")
+            logger.error(
+                "connector_failed",
+                connector=name,
+                error_type=type(result).__name__,
+                error=str(result),
+            )
+        else:
+            all_events.extend(result)
             sources_used.append(name)
-            logger.info("connector_complete", connector=name, events=len(events))
-        except Exception as e:
-            errors.append(f"{name}: {str(e)}")
-            logger.error("connector_failed", connector=name, error=str(e))
-        finally:
-            connector.close()
+            logger.info("connector_complete", connector=name, events=len(result))
 
     # Always merge snapshot data for richer narratives in demo mode
     snapshot_events = _load_all_snapshots(window_start, window_end)
@@ -135,10 +140,13 @@ def run_pipeline(
     ranked_narratives = []
 
     for rank, (candidate, score) in enumerate(ranked, 1):
-        explanation = explainer.build_explanation(candidate, score)
-        why_now = explainer.build_why_now(candidate, score, window_start, window_end)
-        evidence_cards = explainer.build_evidence_cards(candidate, score)
-        confidence, confidence_reasoning = explainer.compute_confidence(candidate, score)
+        (
+            explanation,
+            why_now,
+            evidence_cards,
+            confidence,
+            confidence_reasoning,
+        ) = explainer.explain_all(candidate, score, window_start, window_end)
 
         # ====== Stage G: Idea Generation ======
         idea_gen = IdeaGenerator(config)
@@ -200,35 +208,48 @@ def run_pipeline(
 def _build_timeline(events, window_start, window_end):
     """Build daily event count timeline for chart data."""
     from collections import Counter
-    daily = Counter()
-    for event in events:
-        day = event.timestamp.strftime("%Y-%m-%d")
-        daily[day] += 1
+    daily = Counter(event.timestamp.date() for event in events)
 
     # Fill gaps
     current = window_start
     timeline = []
     while current <= window_end:
         day_str = current.strftime("%Y-%m-%d")
-        timeline.append({"date": day_str, "count": daily.get(day_str, 0)})
+        timeline.append({"date": day_str, "count": daily.get(current.date(), 0)})
         current += timedelta(days=1)
 
     return timeline
 
 
+async def _fetch_all(connectors, window_start, window_end):
+    """Run every connector's fetch concurrently in worker threads.
+
+    The connectors are independent and I/O-bound, so ingestion takes as long
+    as the slowest one rather than the sum. Results come back in connector
+    order; a connector that raised yields its exception instead of events.
+    """
+
+    async def _fetch(connector):
+        try:
+            return await asyncio.to_thread(connector.fetch, window_start, window_end)
+        finally:
+            connector.close()
+
+    return await asyncio.gather(
+        *(_fetch(connector) for _, connector in connectors), return_exceptions=True
+    )
+
+
 def _load_all_snapshots(window_start, window_end):
     """Load all available snapshot data as fallback."""
-    from pipeline.models import SignalEvent
-    import json
+    from pipeline.models import decode_events
 
     events = []
     snapshot_dir = Path("data/snapshots")
     if snapshot_dir.exists():
         for path in snapshot_dir.glob("*.json"):
             try:
-                data = json.loads(path.read_text())
-                for item in data:
-                    events.append(SignalEvent.from_dict(item))
+                events.extend(decode_events(path.read_bytes()))
             except Exception:
                 continue
     return events
@@ -260,7 +260,7 @@ class NarrativeScorer:
 
     def _compute_single_source_penalty(self, events: list[SignalEvent]) -> float:
         """Penalize narratives dominated by a single source category."""
-        source_counts = Counter(e.source_subtype.value for e in events)
+        source_counts = Counter([e.source_subtype for e in events])
         if not source_counts:
             return 0.0
 
@@ -288,10 +288,10 @@ class NarrativeScorer:
             # Get baseline events matching this candidate's entities
             candidate_baseline = None
             if baseline_events:
-                candidate_entities = set(candidate.entities)
+                candidate_entities = frozenset(candidate.entities)
                 candidate_baseline = [
                     e for e in baseline_events
-                    if candidate_entities.intersection(set(e.entities))
+                    if not candidate_entities.isdisjoint(e.entities)
                 ]
 
             score = self.score_narrative(
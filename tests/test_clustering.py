@@ -1,8 +1,11 @@
 """Tests for narrative clustering."""
 
 import pytest
+from collections import defaultdict
 from datetime import datetime, timezone
+from itertools import combinations
 
+import pipeline.clustering as clustering
 from pipeline.models import SignalEvent, SourceType, SourceSubtype
 from pipeline.clustering import NarrativeClusterer
 from pipeline.config import load_config
@@ -28,6 +31,43 @@ def _make_event(entities, text, subtype=SourceSubtype.GITHUB):
     )
 
 
+def _bfs_entity_clusters(events, min_cooccurrence=2, min_standalone_mentions=3):
+    """Reference co-occurrence clustering: pair counts, then BFS components."""
+    cooccurrence = defaultdict(int)
+    entity_counts = defaultdict(int)
+    for event in events:
+        entities = [e for e in event.entities if e != "solana-ecosystem"]
+        for entity in entities:
+            entity_counts[entity] += 1
+        for pair in combinations(sorted(set(entities)), 2):
+            cooccurrence[pair] += 1
+
+    adjacency = defaultdict(set)
+    for (a, b), count in cooccurrence.items():
+        if count >= min_cooccurrence:
+            adjacency[a].add(b)
+            adjacency[b].add(a)
+
+    visited = set()
+    clusters = []
+    for entity in adjacency:
+        if entity in visited:
+            continue
+        cluster = set()
+        queue = [entity]
+        while queue:
+            node = queue.pop(0)
+            if node not in visited:
+                visited.add(node)
+                cluster.add(node)
+                queue.extend(adjacency[node] - visited)
+        clusters.append(cluster)
+    for entity, count in entity_counts.items():
+        if entity not in visited and count >= min_standalone_mentions:
+            clusters.append({entity})
+    return clusters
+
+
 class TestEntityCooccurrence:
     """Test entity co-occurrence based clustering."""
 
@@ -67,6 +107,31 @@ class TestEntityCooccurrence:
         # Should get fallback
         assert len(candidates) >= 1
 
+    def test_union_find_matches_bfs(self, clusterer):
+        """Union-find components should equal a plain BFS over the pair graph."""
+        events = [
+            # jupiter-defi and defi-drift chain into one component
+            _make_event(["jupiter", "defi"], "a"),
+            _make_event(["jupiter", "defi", "solana-ecosystem"], "b"),
+            _make_event(["defi", "drift"], "c"),
+            _make_event(["drift", "defi", "drift"], "d"),
+            # tensor-nft is its own component
+            _make_event(["tensor", "nft"], "e"),
+            _make_event(["nft", "tensor"], "f"),
+            # a single co-occurrence doesn't link jito to tensor
+            _make_event(["jito", "tensor"], "g"),
+            _make_event(["jito"], "h"),
+            _make_event(["jito"], "i"),
+            # too few mentions to stand alone
+            _make_event(["helium"], "j"),
+            _make_event(["solana-ecosystem"], "k"),
+        ]
+        clusters = clusterer._entity_cooccurrence_clusters(events)
+        expected = _bfs_entity_clusters(events)
+        assert sorted(map(sorted, clusters)) == sorted(map(sorted, expected))
+        assert {"jupiter", "defi", "drift"} in clusters
+        assert {"jito"} in clusters
+
 
 class TestTextClustering:
     """Test text-based clustering."""
@@ -89,6 +154,62 @@ class TestTextClustering:
         candidates = clusterer.generate_candidates([])
         assert candidates == []
 
+    def test_skipped_when_entities_cover_events(self, clusterer, monkeypatch):
+        """Text clustering should not run when entity clusters cover nearly everything."""
+
+        def fail(events):
+            raise AssertionError("text clustering ran")
+
+        monkeypatch.setattr(clusterer, "_text_clusters", fail)
+        events = [_make_event(["jupiter", "defi"], f"Jupiter DeFi update {i}") for i in range(10)]
+        events.append(_make_event(["misc"], "Unrelated note"))
+        assert clusterer.generate_candidates(events)
+
+    def test_runs_when_many_events_uncovered(self, clusterer, monkeypatch):
+        """Text clustering should run once enough events fall outside entity clusters."""
+        calls = []
+        monkeypatch.setattr(clusterer, "_text_clusters", lambda events: calls.append(events) or [])
+        events = [_make_event(["jupiter", "defi"], f"Jupiter DeFi update {i}") for i in range(4)]
+        events += [_make_event([f"entity{i}"], f"Firedancer benchmark {i}") for i in range(6)]
+        clusterer.generate_candidates(events)
+        assert len(calls) == 1
+
+    def test_runs_when_entity_clusters_are_too_small(self, clusterer, monkeypatch):
+        """Events only in entity clusters below min_cluster_size should count as uncovered."""
+        calls = []
+        monkeypatch.setattr(clusterer, "_text_clusters", lambda events: calls.append(events) or [])
+        events = [
+            _make_event([f"alpha{i}", f"beta{i}"], f"Pair announcement {i} copy {copy}")
+            for i in range(5)
+            for copy in range(2)
+        ]
+        assert clusterer._entity_cooccurrence_clusters(events)
+        clusterer.generate_candidates(events)
+        assert len(calls) == 1
+
+    def test_minibatch_kmeans_above_dense_limit(self, clusterer, monkeypatch):
+        """Past the dense limit, k-means should replace average linkage."""
+        fitted = []
+
+        class RecordingKMeans(clustering.MiniBatchKMeans):
+            def fit_predict(self, X, *args, **kwargs):
+                fitted.append(X.shape)
+                return super().fit_predict(X, *args, **kwargs)
+
+        def no_linkage(**kwargs):
+            raise AssertionError("average linkage used above the dense limit")
+
+        monkeypatch.setattr(clustering, "TEXT_CLUSTER_DENSE_LIMIT", 10)
+        monkeypatch.setattr(clustering, "MiniBatchKMeans", RecordingKMeans)
+        monkeypatch.setattr(clustering, "AgglomerativeClustering", no_linkage)
+        topics = ["firedancer validator benchmark", "helium depin hotspot", "jito mev tips"]
+        events = [
+            _make_event([f"entity{i}"], f"{topics[i % 3]} report {i}") for i in range(12)
+        ]
+        clusters = clusterer._text_clusters(events)
+        assert fitted and fitted[0][0] == 12
+        assert sorted(i for c in clusters for i in c) == list(range(12))
+
 
 class TestCandidateEnrichment:
     """Test label and description generation."""
@@ -114,3 +235,24 @@ class TestCandidateEnrichment:
         for c in candidates:
             assert c.description
             assert "signal events" in c.description.lower() or "signals" in c.description.lower() or len(c.description) > 0
+
+
+class TestCosineDistances:
+    """Test the pairwise distance matrix behind text clustering."""
+
+    def test_simsimd_matches_sparse_on_empty_rows(self, monkeypatch):
+        """Rows with no terms should be unrelated to everything on both paths."""
+        simsimd = pytest.importorskip("simsimd")
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        import pipeline.clustering as clustering
+
+        texts = ["jito mev tips", "jito mev bundles", "", "", "helium depin"]
+        tfidf = TfidfVectorizer(norm="l2").fit_transform(texts)
+
+        monkeypatch.setattr(clustering, "simsimd", simsimd)
+        fast = clustering._cosine_distances(tfidf)
+        monkeypatch.setattr(clustering, "simsimd", None)
+        fallback = clustering._cosine_distances(tfidf)
+
+        assert fast[2, 3] == 1
+        assert fast == pytest.approx(fallback, abs=1e-5)
@@ -0,0 +1,356 @@
+"""Tests for connector HTTP plumbing: feeds, rate limiting, circuit breakers."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import diskcache
+import httpx
+import pytest
+
+import connectors.base as base
+import connectors.circuit as circuit
+import connectors.twitter_connector as twitter_connector
+from connectors.feeds import fetch_feed_entries
+from connectors.twitter_connector import TwitterConnector
+from pipeline.config import load_config
+from pipeline.models import SignalEvent, SourceSubtype, SourceType
+
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>feed</title>
+<item><title>Jito tips hit a new high</title><link>https://x.com/a/status/1</link></item>
+<item><title>Firedancer on testnet</title><link>https://x.com/a/status/2</link></item>
+</channel></rss>"""
+
+
+class _StubConnector(base.BaseConnector):
+    name = "stub"
+    rate_limit_rps = 2.0
+    rate_limit_burst = 3.0
+
+    def fetch(self, window_start, window_end):
+        return []
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(base.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def config():
+    return load_config()
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the connectors' async HTTP client through a handler."""
+
+    def install(handler):
+        monkeypatch.setattr(
+            base.httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(handler)
+        )
+
+    return install
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    """Let tenacity retry failed fetches without sleeping in between."""
+    from tenacity import wait_none
+
+    monkeypatch.setattr(base.BaseConnector._afetch_url.retry, "wait", wait_none())
+
+
+@pytest.fixture
+def fresh_breakers(monkeypatch):
+    """Isolate the per-host circuit breaker registry."""
+    monkeypatch.setattr(circuit, "_BREAKERS", {})
+
+
+class TestFeedFetching:
+    """Test conditional feed downloads."""
+
+    def test_redirected_nitter_feed(self, config, mock_http):
+        """A feed that 301s to a canonical host should still be read."""
+
+        def handler(request):
+            if request.url.host == "nitter.old":
+                return httpx.Response(
+                    301, headers={"Location": f"https://nitter.new{request.url.path}"}
+                )
+            return httpx.Response(200, content=RSS_BODY)
+
+        mock_http(handler)
+        connector = TwitterConnector(config, cache_enabled=False)
+        try:
+            feeds = connector._fetch_nitter_feeds("https://nitter.old", ["solana"])
+        finally:
+            connector.close()
+        assert feeds[0] is not None
+        assert [entry.title for entry in feeds[0]] == [
+            "Jito tips hit a new high",
+            "Firedancer on testnet",
+        ]
+
+    def test_failing_nitter_feeds_open_breaker(
+        self, config, mock_http, no_retry_wait, fresh_breakers
+    ):
+        """Feed download failures should count against the instance's breaker."""
+        mock_http(lambda request: httpx.Response(503))
+        connector = TwitterConnector(config, cache_enabled=False)
+        connector.rate_limit_rps = 1000.0
+        try:
+            feeds = connector._fetch_nitter_feeds(
+                "https://nitter.down", ["a", "b", "c", "d", "e"]
+            )
+        finally:
+            connector.close()
+        assert feeds == [None] * 5
+        assert circuit.breaker_for("https://nitter.down").state == circuit.OPEN
+
+    def test_not_modified_reuses_stored_entries(self, config, mock_http, tmp_path):
+        """A 304 should serve the entries parsed from the earlier 200."""
+        seen_etags = []
+
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS_BODY, headers={"ETag": '"v1"'})
+
+        mock_http(handler)
+        connector = _StubConnector(config)
+        state = diskcache.Cache(str(tmp_path / "feeds"))
+        try:
+            first = fetch_feed_entries(connector, ["https://blog.example/feed"], state, 5)
+            second = fetch_feed_entries(connector, ["https://blog.example/feed"], state, 5)
+        finally:
+            state.close()
+            connector.close()
+        assert seen_etags == [None, '"v1"']
+        assert [e.title for e in second[0]] == [e.title for e in first[0]]
+        assert len(second[0]) == 2
+
+
+def _count_failed_fetch(config, mock_http, status):
+    """GET a URL that always answers ``status``; return how many attempts were made."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(status)
+
+    async def run(connector):
+        async with connector._async_client() as client:
+            await connector._afetch_url(client, "https://api.example/x")
+
+    mock_http(handler)
+    connector = _StubConnector(config)
+    connector.rate_limit_rps = 1000.0
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run(connector))
+    finally:
+        connector.close()
+    return len(calls)
+
+
+class TestNitterProbe:
+    """Test the shared Nitter instance probe."""
+
+    def test_down_result_expires_quickly(self, config, clock, monkeypatch, fresh_breakers):
+        """An all-down probe is reused briefly, then retried; the lock is free while probing."""
+        monkeypatch.setattr(twitter_connector, "_nitter_probe", None)
+        answers = iter([None, "https://nitter.up"])
+        probes = []
+
+        async def fake_probe():
+            probes.append(twitter_connector._nitter_probe_lock.locked())
+            return next(answers)
+
+        def find():
+            connector = TwitterConnector(config, cache_enabled=False)
+            monkeypatch.setattr(connector, "_aprobe_nitter", fake_probe)
+            try:
+                return connector._find_working_nitter()
+            finally:
+                connector.close()
+
+        assert find() is None
+        assert find() is None
+        assert probes == [False]
+
+        clock.now += twitter_connector.NITTER_DOWN_TTL
+        assert find() == "https://nitter.up"
+        assert probes == [False, False]
+
+
+class TestTweetStore:
+    """Test the per-day store of tweets seen by earlier runs."""
+
+    def _tweet(self, day, text):
+        return SignalEvent(
+            timestamp=datetime(2026, 2, day, 12, tzinfo=timezone.utc),
+            source_type=SourceType.OFFCHAIN,
+            source_subtype=SourceSubtype.TWITTER,
+            entities=["jito"],
+            text=text,
+            url=f"https://x.com/a/status/{day}",
+            author="a",
+        )
+
+    def test_window_reads_only_its_days(self, config, tmp_path):
+        """Earlier tweets in the window come back; other days are never read."""
+        connector = TwitterConnector(config, cache_enabled=False)
+        store = connector._event_store = diskcache.Cache(str(tmp_path / "tweets"))
+        try:
+            early, late = self._tweet(2, "early"), self._tweet(20, "late")
+            connector._merge_stored_events(
+                [early, late], datetime(2026, 2, 1), datetime(2026, 2, 21)
+            )
+
+            read = []
+            original_get = store.get
+            store.get = lambda key, *args, **kwargs: read.append(key) or original_get(key)
+            merged = connector._merge_stored_events(
+                [], datetime(2026, 2, 1), datetime(2026, 2, 4)
+            )
+        finally:
+            connector.close()
+            store.close()
+        assert [e.text for e in merged] == ["early"]
+        assert read == [f"twitter:2026-02-0{day}" for day in range(1, 5)]
+
+
+class TestRetries:
+    """Test the shared transient-only retry policy."""
+
+    def test_permanent_status_not_retried(self, config, mock_http, no_retry_wait):
+        """A 404 should surface once, as the original HTTPStatusError."""
+        assert _count_failed_fetch(config, mock_http, 404) == 1
+
+    def test_transient_status_retried(self, config, mock_http, no_retry_wait):
+        """A 503 should be retried, then re-raised rather than wrapped in RetryError."""
+        assert _count_failed_fetch(config, mock_http, 503) == 3
+
+    def test_rate_limited_waits_retry_after_once(self, config, mock_http, monkeypatch):
+        """A 429 should wait out Retry-After in tenacity, not sleep again in the body."""
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+        responses = iter([httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)])
+        mock_http(lambda request: next(responses))
+        connector = _StubConnector(config)
+        connector.rate_limit_rps = 1000.0
+
+        async def run():
+            async with connector._async_client() as client:
+                return await connector._afetch_url(client, "https://api.example/x")
+
+        try:
+            assert asyncio.run(run()).status_code == 200
+        finally:
+            connector.close()
+        assert slept == [7.0]
+
+
+class TestRateLimiting:
+    """Test the token-bucket limiter."""
+
+    def test_burst_then_paced(self, config, clock):
+        """A full bucket allows a burst; after that callers wait 1/rps apart."""
+        connector = _StubConnector(config)
+        try:
+            waits = [connector._acquire_token() for _ in range(5)]
+            assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+            # One second refills two tokens, which only pays off the debt
+            clock.now += 1.0
+            assert connector._acquire_token() == pytest.approx(0.5)
+            # A long idle refills up to the burst size, no further
+            clock.now += 60.0
+            assert [connector._acquire_token() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+        finally:
+            connector.close()
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_closed_open_half_open_cycle(self, clock):
+        """Failures open the breaker; after the cooldown one probe decides."""
+        breaker = circuit.CircuitBreaker("host", failure_threshold=3, cooldown=10.0)
+        for _ in range(3):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.state == circuit.OPEN
+        assert not breaker.allow()
+
+        clock.now += 10.0
+        assert breaker.allow()
+        assert breaker.state == circuit.HALF_OPEN
+        assert not breaker.allow()  # one probe at a time
+
+        # A failed probe re-opens with a doubled cooldown
+        breaker.record_failure()
+        assert breaker.state == circuit.OPEN
+        clock.now += 10.0
+        assert not breaker.allow()
+        clock.now += 10.0
+        assert breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == circuit.CLOSED
+        assert breaker.cooldown == 10.0
+        assert breaker.allow()
+
+
+class TestGitHubReleases:
+    """Test batched GraphQL release lookups."""
+
+    def test_graphql_errors_fall_back_to_rest(self, config, monkeypatch):
+        """A 200 response carrying GraphQL errors should use the REST endpoint."""
+        from connectors import github_connector
+
+        def handler(request):
+            if request.url.path == "/graphql":
+                return httpx.Response(
+                    200, json={"errors": [{"message": "API rate limit exceeded"}], "data": None}
+                )
+            return httpx.Response(
+                200,
+                json=[{"tag_name": "v1.0", "name": "v1.0", "published_at": "2026-02-01T00:00:00Z"}],
+            )
+
+        monkeypatch.setattr(
+            github_connector.httpx,
+            "AsyncHTTPTransport",
+            lambda **kwargs: httpx.MockTransport(handler),
+        )
+        connector = github_connector.GitHubConnector(config, cache_enabled=False)
+
+        async def run():
+            async with connector._async_client() as client:
+                return await connector._get_releases_graphql(
+                    client, asyncio.Semaphore(4), [("jito-foundation", "jito-solana")]
+                )
+
+        try:
+            releases = asyncio.run(run())
+        finally:
+            connector.close()
+        assert [r["tag_name"] for r in releases[0]] == ["v1.0"]
@@ -1,9 +1,12 @@
 """Tests for event normalization and deduplication."""
 
+import random
+
 import pytest
 from datetime import datetime, timezone
 
 from pipeline.models import SignalEvent, SourceType, SourceSubtype
+import pipeline.normalizer as normalizer_module
 from pipeline.normalizer import EventNormalizer
 from pipeline.config import load_config
 
@@ -28,6 +31,23 @@ def _make_event(entities, text="Test", timestamp=None):
     )
 
 
+def _near_duplicate_group():
+    """Distinct announcements, each followed by copies that differ by a suffix."""
+    topics = [
+        "Jupiter Exchange launches limit orders with a new aggregation engine",
+        "Drift protocol reaches one billion dollars in perpetual futures volume",
+        "Tensor NFT marketplace ships compressed NFT trading for creators",
+        "Helium migrates its DePIN hotspot network and token to Solana mainnet",
+        "Firedancer validator client passes a million TPS benchmark on testnet",
+        "Marinade Finance introduces native staking with automatic delegation",
+    ]
+    events = []
+    for copy in range(3):
+        for topic in topics:
+            events.append(_make_event(["solana"], topic + " !" * copy))
+    return events
+
+
 class TestEntityNormalization:
     """Test entity alias resolution."""
 
@@ -106,3 +126,61 @@ class TestDeduplication:
         for event in result:
             for entity in event.entities:
                 assert entity == entity.lower()
+
+    def test_matrix_and_scan_paths_agree(self, normalizer):
+        """The similarity matrix and the incremental scan should keep the same events."""
+        group = _near_duplicate_group()
+        matrix_kept = normalizer._dedup_group_matrix(group)
+        scan_kept = normalizer._dedup_group(group)
+        assert len(matrix_kept) == 6
+        assert [e.text for e in matrix_kept] == [e.text for e in scan_kept]
+
+    def test_large_group_without_lsh_skips_matrix(self, normalizer, monkeypatch):
+        """Without datasketch, large groups should not build the n x n matrix."""
+        def fail(group):
+            raise AssertionError("dense matrix built for a large group")
+
+        monkeypatch.setattr(normalizer_module, "MinHashLSH", None)
+        monkeypatch.setattr(normalizer, "_dedup_group_matrix", fail)
+        events = [
+            _make_event(["solana"], f"Distinct announcement number {i} " * 2)
+            for i in range(normalizer_module.LSH_MIN_GROUP)
+        ]
+        assert len(normalizer.deduplicate(events)) > 0
+
+    def test_lsh_matches_exact_scan(self, normalizer):
+        """On a large group, LSH candidates should find the same duplicates as a full scan."""
+        pytest.importorskip("datasketch")
+        rng = random.Random(7)
+        words = (
+            "jupiter drift tensor helium jito marinade orca raydium phantom validator "
+            "staking perps lending swap bridge wallet mobile payments gaming oracle"
+        ).split()
+        topics = [" ".join(rng.choice(words) for _ in range(14)) for _ in range(80)]
+        group = [_make_event(["solana"], topic + " !" * copy) for copy in range(3) for topic in topics]
+        assert len(group) >= normalizer_module.LSH_MIN_GROUP
+
+        lsh_kept = normalizer._dedup_group_lsh(group)
+        exact_kept = normalizer._dedup_group(group)
+        assert [e.text for e in lsh_kept] == [e.text for e in exact_kept]
+        assert len(lsh_kept) < len(group)
+
+    def test_near_duplicate_dedup_ignores_group_size(self, normalizer):
+        """A near-duplicate pair should be deduped the same below and above LSH_MIN_GROUP."""
+        rng = random.Random(11)
+        words = (
+            "jupiter drift tensor helium jito marinade orca raydium phantom validator "
+            "staking perps lending swap bridge wallet mobile payments gaming oracle"
+        ).split()
+        original = "Jupiter Exchange launches limit orders with a new aggregation engine"
+        pair = [_make_event(["solana"], original), _make_event(["solana"], original + " !")]
+        for size in (normalizer_module.LSH_MIN_GROUP - 1, normalizer_module.LSH_MIN_GROUP + 1):
+            filler = [
+                _make_event(["solana"], " ".join(rng.choice(words) for _ in range(14)))
+                for _ in range(size - len(pair))
+            ]
+            result = normalizer.deduplicate(pair + filler)
+            texts = [e.text for e in result]
+            assert original in texts
+            assert original + " !" not in texts
+            assert len(result) == size - 1
@@ -0,0 +1,64 @@
+"""Tests for dashboard report loading."""
+
+import orjson
+
+from app.streamlit_app import _reconstruct_report
+
+
+def _old_report() -> dict:
+    """A report from before why_now and validation_approach were written."""
+    return {
+        "run_id": "old-run",
+        "window_start": "2026-01-20T00:00:00+00:00",
+        "window_end": "2026-02-03T00:00:00+00:00",
+        "baseline_start": "2025-12-23T00:00:00+00:00",
+        "generated_at": "2026-02-03T06:00:00+00:00",
+        "narratives": [
+            {
+                "rank": 1,
+                "narrative_id": "n1",
+                "label": "MEV",
+                "explanation": "Jito tips are climbing.",
+                "score": {"composite": 0.7},
+                "confidence": 0.6,
+                "confidence_reasoning": "Two sources.",
+                "evidence_cards": [
+                    {
+                        "event": {
+                            "timestamp": "2026-01-28T12:00:00+00:00",
+                            "source_type": "onchain",
+                            "source_subtype": "tx_activity",
+                            "entities": ["jito"],
+                            "text": "Tip volume up",
+                        },
+                        "relevance_score": 0.9,
+                        "summary": "Tip volume up",
+                    }
+                ],
+                "build_ideas": [
+                    {
+                        "title": "Tip dashboard",
+                        "problem_statement": "Tips are opaque.",
+                        "target_user": "Searchers",
+                        "why_solana": "Jito lives here.",
+                        "mvp_scope": "A chart.",
+                        "risks_unknowns": "Data access.",
+                        "category": "analytics",
+                    }
+                ],
+            }
+        ],
+    }
+
+
+class TestReportLoading:
+    """Test decoding saved reports."""
+
+    def test_old_format_report_loads(self):
+        """Fields missing from older reports should fall back to defaults."""
+        report = _reconstruct_report(orjson.dumps(_old_report()))
+        narrative = report.narratives[0]
+        assert report.run_id == "old-run"
+        assert narrative.why_now == ""
+        assert narrative.build_ideas[0].validation_approach == ""
+        assert narrative.evidence_cards[0].event.entities == ["jito"]